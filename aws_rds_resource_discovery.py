@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+# PYTHON_ARGCOMPLETE_OK
 """
 AWS RDS Billable Resource Discovery CLI Tool
 
@@ -7,17 +8,132 @@ associated with AWS RDS DB instances and DB clusters.
 """
 
 import argparse
+import functools
+import logging
 import sys
 import os
-from typing import Dict, Any, Optional
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Dict, Any, List, Optional, Tuple
 
-# Import our modules
-from rds_resource_discovery import RDSResourceDiscovery
-from rds_table_formatter import RDSResourceTableFormatter
+# Our discovery and formatter modules pull in boto3 and tabulate, so
+# they are imported lazily where used to keep --help/--version fast.
 
+logger = logging.getLogger('rds_discovery')
 
-def parse_arguments():
-    """Parse command line arguments."""
+
+@functools.lru_cache(maxsize=None)
+def _banner() -> str:
+    """Section separator sized to the terminal (80 columns when not a TTY)."""
+    return '=' * shutil.get_terminal_size((80, 24)).columns
+
+
+# (label, value getter) pairs for the resource header of each resource type
+_INSTANCE_FIELDS = (
+    ('DB Instance ID', itemgetter('db_instance_id')),
+    ('Instance Class', itemgetter('db_instance_class')),
+    ('Engine', lambda d: f"{d['engine']} {d['engine_version']}"),
+    ('Status', itemgetter('status')),
+    ('Storage', lambda d: f"{d['allocated_storage']} GB ({d['storage_type']})"),
+    ('Encrypted', itemgetter('storage_encrypted')),
+    ('Multi-AZ', itemgetter('multi_az')),
+    ('Availability Zone', itemgetter('availability_zone')),
+    ('VPC ID', itemgetter('vpc_id')),
+    ('Endpoint', lambda d: f"{d['endpoint']}:{d['port']}"),
+)
+
+_CLUSTER_FIELDS = (
+    ('DB Cluster ID', itemgetter('db_cluster_id')),
+    ('Engine', lambda d: f"{d['engine']} {d['engine_version']}"),
+    ('Status', itemgetter('status')),
+    ('Storage', lambda d: f"{d['allocated_storage']} GB"),
+    ('Encrypted', itemgetter('storage_encrypted')),
+    ('Availability Zones', lambda d: ', '.join(d['availability_zones'])),
+    ('VPC ID', itemgetter('vpc_id')),
+    ('Endpoint', lambda d: f"{d['endpoint']}:{d['port']}"),
+    ('Reader Endpoint', itemgetter('reader_endpoint')),
+    ('Cluster Members', lambda d: ', '.join(d['cluster_members'])),
+)
+
+
+_VERSION = 'AWS RDS Resource Discovery Tool v1.0.0'
+
+# Pre-rendered `--help` text (80 columns) so a bare --help never builds the
+# parser; test_rds_solution.py checks it against the real argparse output
+_HELP_PROG = 'aws_rds_resource_discovery.py'
+_STATIC_HELP = """\
+usage: aws_rds_resource_discovery.py [-h] [--cluster] [--region REGION]
+                                     [--profile PROFILE] [--cache-ttl SECONDS]
+                                     [--cache-dir PATH]
+                                     [--format {grid,simple,fancy_grid,pipe,orgtbl,rst,mediawiki,html,latex}]
+                                     [--detailed] [--summary-only] [--quiet]
+                                     [--export-csv FILENAME]
+                                     [--export-json FILENAME] [--version]
+                                     identifier
+
+Discover and list all billable resources associated with an AWS RDS DB instance or cluster
+
+positional arguments:
+  identifier            RDS DB instance identifier or DB cluster identifier
+
+options:
+  -h, --help            show this help message and exit
+  --cluster             Treat the identifier as a DB cluster identifier
+                        instead of DB instance
+  --region REGION       AWS region name (default: use AWS CLI default or
+                        environment)
+  --profile PROFILE     AWS profile name (default: use AWS CLI default)
+  --cache-ttl SECONDS   Reuse RDS/EC2 describe responses cached on disk for up
+                        to SECONDS (default: 0, disabled)
+  --cache-dir PATH      Directory for cached API responses (default:
+                        ~/.cache/rds-discovery)
+  --format {grid,simple,fancy_grid,pipe,orgtbl,rst,mediawiki,html,latex}
+                        Table format for output (default: grid)
+  --detailed            Show detailed tables grouped by resource type
+  --summary-only        Show only the resource summary table
+  --quiet               Print only export results and errors (useful with
+                        --export-csv/--export-json in scripts)
+  --export-csv FILENAME
+                        Export resources to CSV file
+  --export-json FILENAME
+                        Export complete results to JSON file
+  --version             show program's version number and exit
+
+Examples:
+  aws_rds_resource_discovery.py my-db-instance
+  aws_rds_resource_discovery.py my-aurora-cluster --cluster
+  aws_rds_resource_discovery.py my-db-instance --region us-west-2 --profile production
+  aws_rds_resource_discovery.py my-db-instance --detailed --format fancy_grid
+  aws_rds_resource_discovery.py my-db-instance --export-csv resources.csv --export-json results.json
+  aws_rds_resource_discovery.py my-db-instance --export-csv resources.csv --quiet
+"""
+
+
+def _static_fast_path(argv: List[str]) -> bool:
+    """
+    Answer a bare --help or --version from constants.
+    
+    Args:
+        argv: Full command line, normally sys.argv
+        
+    Returns:
+        True if the request was answered and the caller should exit
+    """
+    if len(argv) != 2:
+        return False
+    if argv[1] == '--version':
+        sys.stdout.write(_VERSION + '\n')
+        return True
+    if argv[1] in ('-h', '--help') and os.path.basename(argv[0]) == _HELP_PROG:
+        sys.stdout.write(_STATIC_HELP)
+        return True
+    return False
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser once per process."""
     parser = argparse.ArgumentParser(
         description='Discover and list all billable resources associated with an AWS RDS DB instance or cluster',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -28,7 +144,8 @@ Examples:
   %(prog)s my-db-instance --region us-west-2 --profile production
   %(prog)s my-db-instance --detailed --format fancy_grid
   %(prog)s my-db-instance --export-csv resources.csv --export-json results.json
-        """
+  %(prog)s my-db-instance --export-csv resources.csv --quiet
+"""
     )
     
     parser.add_argument(
@@ -52,6 +169,20 @@ Examples:
         help='AWS profile name (default: use AWS CLI default)'
     )
     
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=0,
+        metavar='SECONDS',
+        help='Reuse RDS/EC2 describe responses cached on disk for up to SECONDS (default: 0, disabled)'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        metavar='PATH',
+        help='Directory for cached API responses (default: ~/.cache/rds-discovery)'
+    )
+    
     parser.add_argument(
         '--format',
         choices=['grid', 'simple', 'fancy_grid', 'pipe', 'orgtbl', 'rst', 'mediawiki', 'html', 'latex'],
@@ -71,6 +202,12 @@ Examples:
         help='Show only the resource summary table'
     )
     
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Print only export results and errors (useful with --export-csv/--export-json in scripts)'
+    )
+    
     parser.add_argument(
         '--export-csv',
         metavar='FILENAME',
@@ -86,131 +223,209 @@ Examples:
     parser.add_argument(
         '--version',
         action='version',
-        version='AWS RDS Resource Discovery Tool v1.0.0'
+        version=_VERSION
     )
     
+    return parser
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = _build_parser()
+    
+    # Shell completion re-runs the tool on every <TAB>; argcomplete answers
+    # and exits here, before any of the heavy imports in main()
+    if '_ARGCOMPLETE' in os.environ:
+        try:
+            import argcomplete
+            argcomplete.autocomplete(parser)
+        except ImportError:
+            pass
+    
     return parser.parse_args()
 
 
-def display_resource_info(discovery_result: Dict[str, Any], args) -> None:
+def _status_marks(stream) -> Tuple[str, str]:
+    """
+    Pick success/failure markers for a stream.
+    
+    Falls back to ASCII when NO_COLOR is set or the stream encoding is not
+    UTF-8 (legacy consoles, some CI runners), where the Unicode marks would
+    go through the encoder's error fallback or fail outright.
+    
+    Args:
+        stream: Text stream the markers will be written to
+        
+    Returns:
+        (ok, fail) marker strings
+    """
+    encoding = (getattr(stream, 'encoding', None) or '').lower().replace('-', '')
+    if 'NO_COLOR' in os.environ or encoding not in ('utf8', 'utf8sig'):
+        return '[OK]', '[FAIL]'
+    return '✓', '✗'
+
+
+class _StatusFormatter(logging.Formatter):
+    """
+    Prefix status messages with a success or failure marker depending on level.
+    
+    Warnings and errors from any logger get the failure marker; the success
+    marker is reserved for the CLI's own results, so engine progress passes
+    through unmarked.
+    """
+    
+    def __init__(self, fmt: str, marks: Tuple[str, str]):
+        super().__init__(fmt)
+        self._ok, self._fail = marks
+    
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        if record.levelno >= logging.WARNING:
+            return f"\n{self._fail} {message}"
+        if record.name == logger.name:
+            return f"\n{self._ok} {message}"
+        return message
+
+
+def configure_logging(quiet: bool = False) -> None:
+    """
+    Send status messages to stderr so they never mix with piped report output.
+    
+    Args:
+        quiet: Hide discovery progress; export results and errors still show
+    """
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(_StatusFormatter('%(message)s', _status_marks(sys.stderr)))
+    logger.handlers[:] = [handler]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    # Engine progress propagates to the handler above unless quiet
+    logging.getLogger('rds_discovery.engine').setLevel(logging.WARNING if quiet else logging.INFO)
+
+
+def display_resource_info(discovery_result: Dict[str, Any], args, formatter) -> None:
     """
     Display the resource information based on the command line arguments.
     
     Args:
         discovery_result: Result from resource discovery
         args: Parsed command line arguments
+        formatter: Shared RDSResourceTableFormatter instance
     """
-    formatter = RDSResourceTableFormatter()
-    
-    # Display basic information
+    # Display basic information, buffered into a single write
     resource_details = discovery_result['resource_details']
     resource_type = discovery_result['resource_type']
     
-    print(f"\n{'='*80}")
-    print(f"AWS RDS Resource Discovery Results")
-    print(f"{'='*80}")
-    
-    if resource_type == 'db_instance':
-        print(f"DB Instance ID: {resource_details['db_instance_id']}")
-        print(f"Instance Class: {resource_details['db_instance_class']}")
-        print(f"Engine: {resource_details['engine']} {resource_details['engine_version']}")
-        print(f"Status: {resource_details['status']}")
-        print(f"Storage: {resource_details['allocated_storage']} GB ({resource_details['storage_type']})")
-        print(f"Encrypted: {resource_details['storage_encrypted']}")
-        print(f"Multi-AZ: {resource_details['multi_az']}")
-        print(f"Availability Zone: {resource_details['availability_zone']}")
-        print(f"VPC ID: {resource_details['vpc_id']}")
-        print(f"Endpoint: {resource_details['endpoint']}:{resource_details['port']}")
-        if resource_details['db_cluster_identifier']:
-            print(f"DB Cluster: {resource_details['db_cluster_identifier']}")
-    else:  # db_cluster
-        print(f"DB Cluster ID: {resource_details['db_cluster_id']}")
-        print(f"Engine: {resource_details['engine']} {resource_details['engine_version']}")
-        print(f"Status: {resource_details['status']}")
-        print(f"Storage: {resource_details['allocated_storage']} GB")
-        print(f"Encrypted: {resource_details['storage_encrypted']}")
-        print(f"Availability Zones: {', '.join(resource_details['availability_zones'])}")
-        print(f"VPC ID: {resource_details['vpc_id']}")
-        print(f"Endpoint: {resource_details['endpoint']}:{resource_details['port']}")
-        print(f"Reader Endpoint: {resource_details['reader_endpoint']}")
-        print(f"Cluster Members: {', '.join(resource_details['cluster_members'])}")
-    
-    print(f"Creation Time: {resource_details['creation_time']}")
+    lines = [
+        f"\n{_banner()}",
+        "AWS RDS Resource Discovery Results",
+        _banner(),
+    ]
+    
+    fields = _INSTANCE_FIELDS if resource_type == 'db_instance' else _CLUSTER_FIELDS
+    for label, value in fields:
+        lines.append(f"{label}: {value(resource_details)}")
+    if resource_type == 'db_instance' and resource_details['db_cluster_identifier']:
+        lines.append(f"DB Cluster: {resource_details['db_cluster_identifier']}")
+    
+    lines.append(f"Creation Time: {resource_details['creation_time']}")
     
     # Display tags if any
     if resource_details['tags']:
-        print(f"Tags: {', '.join([f'{k}:{v}' for k, v in resource_details['tags'].items()])}")
+        lines.append("Tags: " + ", ".join(f"{k}:{v}" for k, v in resource_details['tags'].items()))
+    
+    lines.append(f"\nRegion: {args.region or 'default'}")
+    lines.append(f"Total Resources Found: {discovery_result['summary']['total_resources']}")
     
-    print(f"\nRegion: {args.region or 'default'}")
-    print(f"Total Resources Found: {discovery_result['summary']['total_resources']}")
+    # Nothing to tabulate
+    if discovery_result['summary']['total_resources'] == 0:
+        lines.append("(no billable resources discovered)")
+        sys.stdout.write("\n".join(lines) + "\n")
+        return
     
     # Display summary table
-    print(f"\n{'='*80}")
-    print("Resource Summary:")
-    print(f"{'='*80}")
+    lines.append(f"\n{_banner()}")
+    lines.append("Resource Summary:")
+    lines.append(_banner())
+    sys.stdout.write("\n".join(lines) + "\n")
+    
     summary_table = formatter.format_summary_table(discovery_result['summary'], args.format)
-    print(summary_table)
+    sys.stdout.write(summary_table + "\n")
     
     # Display detailed information if not summary-only
     if not args.summary_only:
         if args.detailed:
-            print(f"\n{'='*80}")
-            print("Detailed Resource Information:")
-            print(f"{'='*80}")
-            detailed_table = formatter.format_detailed_resources_table(
-                discovery_result['resources'], args.format
+            # Per-type tables are streamed as they are rendered
+            sys.stdout.write(f"\n{_banner()}\nDetailed Resource Information:\n{_banner()}\n")
+            formatter.format_detailed_resources_stream(
+                discovery_result['resources'], args.format, sys.stdout
             )
-            print(detailed_table)
+            sys.stdout.write("\n")
         else:
-            print(f"\n{'='*80}")
-            print("All Resources:")
-            print(f"{'='*80}")
             resources_table = formatter.format_resources_table(
                 discovery_result['resources'], args.format
             )
-            print(resources_table)
+            sys.stdout.write(f"\n{_banner()}\nAll Resources:\n{_banner()}\n")
+            sys.stdout.write(resources_table + "\n")
 
 
-def export_results(discovery_result: Dict[str, Any], args) -> None:
+def export_results(discovery_result: Dict[str, Any], args, formatter) -> None:
     """
     Export results to files if requested.
     
     Args:
         discovery_result: Result from resource discovery
         args: Parsed command line arguments
+        formatter: Shared RDSResourceTableFormatter instance
     """
-    formatter = RDSResourceTableFormatter()
-    
+    exports = []
     if args.export_csv:
-        try:
-            message = formatter.export_to_csv(discovery_result['resources'], args.export_csv)
-            print(f"\n✓ {message}")
-        except Exception as e:
-            print(f"\n✗ Error exporting to CSV: {str(e)}")
-    
+        exports.append(('CSV', formatter.export_to_csv, discovery_result['resources'], args.export_csv))
     if args.export_json:
-        try:
-            message = formatter.export_to_json(discovery_result, args.export_json)
-            print(f"\n✓ {message}")
-        except Exception as e:
-            print(f"\n✗ Error exporting to JSON: {str(e)}")
+        exports.append(('JSON', formatter.export_to_json, discovery_result, args.export_json))
+    if not exports:
+        return
+    
+    # The exports write independent files, so run them side by side
+    with ThreadPoolExecutor(max_workers=len(exports)) as executor:
+        futures = [
+            (label, executor.submit(export, data, filename))
+            for label, export, data, filename in exports
+        ]
+        for label, future in futures:
+            try:
+                logger.info("%s", future.result())
+            except Exception as e:
+                logger.error("Error exporting to %s: %s", label, e)
 
 
 def main():
     """Main function."""
+    if _static_fast_path(sys.argv):
+        return
+    
     try:
         # Parse command line arguments
         args = parse_arguments()
+        configure_logging(args.quiet)
         
         # Initialize the discovery tool
-        print(f"Initializing AWS RDS Resource Discovery...")
-        print(f"Target: {'DB Cluster' if args.cluster else 'DB Instance'} '{args.identifier}'")
-        if args.region:
-            print(f"Region: {args.region}")
-        if args.profile:
-            print(f"Profile: {args.profile}")
+        if not args.quiet:
+            print(f"Initializing AWS RDS Resource Discovery...")
+            print(f"Target: {'DB Cluster' if args.cluster else 'DB Instance'} '{args.identifier}'")
+            if args.region:
+                print(f"Region: {args.region}")
+            if args.profile:
+                print(f"Profile: {args.profile}")
+        
+        from rds_resource_discovery import RDSResourceDiscovery
         
-        discovery = RDSResourceDiscovery(region_name=args.region, profile_name=args.profile)
+        discovery = RDSResourceDiscovery(
+            region_name=args.region,
+            profile_name=args.profile,
+            cache_ttl=args.cache_ttl,
+            cache_dir=args.cache_dir
+        )
         
         # Discover resources
         if args.cluster:
@@ -219,24 +434,31 @@ def main():
             discovery_result = discovery.discover_db_instance_resources(args.identifier)
         
         if not discovery_result:
-            print(f"\n✗ Failed to discover resources for {args.identifier}")
+            logger.error("Failed to discover resources for %s", args.identifier)
             sys.exit(1)
         
-        # Display results
-        display_resource_info(discovery_result, args)
+        # One formatter serves both display and export
+        from rds_table_formatter import RDSResourceTableFormatter
+        
+        formatter = RDSResourceTableFormatter()
+        
+        # Display results unless only exports were wanted
+        if not args.quiet:
+            display_resource_info(discovery_result, args, formatter)
         
         # Export results if requested
-        export_results(discovery_result, args)
+        export_results(discovery_result, args, formatter)
         
-        print(f"\n{'='*80}")
-        print("✓ Resource discovery completed successfully!")
-        print(f"{'='*80}")
+        if not args.quiet:
+            print(f"\n{_banner()}")
+            print(f"{_status_marks(sys.stdout)[0]} Resource discovery completed successfully!")
+            print(_banner())
         
     except KeyboardInterrupt:
         print("\n\nOperation cancelled by user.")
         sys.exit(1)
     except Exception as e:
-        print(f"\n✗ Error: {str(e)}")
+        logger.error("Error: %s", e)
         sys.exit(1)
 
 
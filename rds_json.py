@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+JSON Serialization for AWS RDS Resource Discovery
+
+This module provides the JSON encoding shared by the discovery engine and the table formatter.
+"""
+
+import json
+from datetime import date, datetime
+from typing import Any
+
+try:
+    import orjson  # Optional: much faster JSON serialization when installed
+except ImportError:
+    orjson = None
+
+
+def json_default(value: Any) -> str:
+    """Render values the json module cannot encode, matching orjson for dates and datetimes."""
+    return value.isoformat() if isinstance(value, (datetime, date)) else str(value)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Uses orjson when it is installed and falls back to the json module;
+    datetimes are written as ISO 8601 strings either way.
+
+    Args:
+        obj: Object to serialize
+        indent: Indent nested structures by two spaces
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=json_default, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=json_default).encode('utf-8')
@@ -6,35 +6,294 @@ This script discovers and lists all billable resources associated with a selecte
 It identifies snapshots, security groups, subnet groups, parameter groups, option groups, and other related resources.
 """
 
+import argparse
 import boto3
+import functools
+import hashlib
+import itertools
 import json
+import logging
+import os
 import sys
-from typing import Dict, List, Any, Optional
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
+import rds_json
+
+
+# Upper bound on concurrent API calls per discovery; the connection pool is
+# sized well above it so threads never queue for a socket, keep-alive holds
+# pooled connections open between discoveries, and adaptive retries absorb
+# throttling from the concurrent fan-out
+_MAX_WORKERS = 8
+_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=32,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+)
+
+# Cap on in-flight API calls per service across all discoveries in the process;
+# nested fan-outs (tags, groups, members) can otherwise stack past the pool size
+_MAX_IN_FLIGHT = 16
+_SERVICE_SEMAPHORES = {
+    'rds': threading.BoundedSemaphore(_MAX_IN_FLIGHT),
+    'ec2': threading.BoundedSemaphore(_MAX_IN_FLIGHT),
+}
+
+# Most ids describe_security_groups accepts through GroupIds in one request
+_SG_GROUP_IDS_LIMIT = 200
+
+# Child of the CLI's logger so its handler and --quiet level apply here too
+logger = logging.getLogger('rds_discovery.engine')
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'rds-discovery')
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_session(profile_name: Optional[str]) -> boto3.Session:
+    """Return a process-wide boto3 Session for the given profile."""
+    return boto3.Session(profile_name=profile_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_client(service_name: str, region_name: Optional[str], profile_name: Optional[str]):
+    """Return a process-wide boto3 client keyed by (service, region, profile)."""
+    return _BoundedClient(
+        _cached_session(profile_name).client(
+            service_name, region_name=region_name, config=_CLIENT_CONFIG
+        ),
+        _SERVICE_SEMAPHORES[service_name]
+    )
+
+
+def _encode_cached_value(value: Any) -> Any:
+    """JSON fallback encoder that preserves datetimes from API responses."""
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    return str(value)
+
+
+def _decode_cached_value(obj: Dict[str, Any]) -> Any:
+    """JSON object hook reversing _encode_cached_value."""
+    if len(obj) == 1 and '__datetime__' in obj:
+        return datetime.fromisoformat(obj['__datetime__'])
+    return obj
+
+
+class _BoundedClient:
+    """
+    Wrap a boto3 client so every API call holds a per-service semaphore while in flight.
+    
+    Paginated calls take the semaphore for each page request rather than for
+    the whole iteration; non-API attributes pass straight through.
+    """
+    
+    def __init__(self, client, semaphore: threading.BoundedSemaphore):
+        self._client = client
+        self._semaphore = semaphore
+    
+    def get_paginator(self, operation_name: str):
+        """Return a paginator whose page requests are bounded like single calls."""
+        return _BoundedPaginator(self._client.get_paginator(operation_name), self._semaphore)
+    
+    def __getattr__(self, name: str):
+        attr = getattr(self._client, name)
+        if name in self._client.meta.method_to_api_mapping:
+            return functools.partial(self._bounded_call, attr)
+        return attr
+    
+    def _bounded_call(self, method, **kwargs) -> Dict[str, Any]:
+        """Make the call once a slot for this service is free."""
+        with self._semaphore:
+            return method(**kwargs)
+
+
+class _BoundedPaginator:
+    """Paginator stand-in that requests each page under the client's semaphore."""
+    
+    def __init__(self, paginator, semaphore: threading.BoundedSemaphore):
+        self._paginator = paginator
+        self._semaphore = semaphore
+    
+    def paginate(self, **kwargs) -> Iterator[Dict[str, Any]]:
+        """Yield each page, holding the semaphore only while it is fetched."""
+        pages = iter(self._paginator.paginate(**kwargs))
+        while True:
+            with self._semaphore:
+                page = next(pages, None)
+            if page is None:
+                return
+            yield page
+
+
+class _CachingClient:
+    """
+    Wrap a boto3 client so read-only RDS/EC2 calls are served from an on-disk TTL cache.
+    
+    Only describe_* and list_tags_for_resource calls (and describe_* paginators)
+    are cached; every other attribute (meta, credential handling) passes straight
+    through to the client.
+    """
+    
+    def __init__(self, client, scope: Tuple[Optional[str], ...], cache_dir: str, ttl: float):
+        """
+        Args:
+            client: The boto3 client to wrap
+            scope: (service, region, profile) tuple that namespaces cache keys
+            cache_dir: Directory holding cached responses
+            ttl: Maximum age in seconds of a cached response
+        """
+        self._client = client
+        self._scope = scope
+        self._cache_dir = cache_dir
+        self._ttl = ttl
+    
+    def get_paginator(self, operation_name: str):
+        """Return a paginator whose describe_* page lists are cached like single calls."""
+        paginator = self._client.get_paginator(operation_name)
+        if not operation_name.startswith('describe_'):
+            return paginator
+        return _CachingPaginator(self, operation_name, paginator)
+    
+    def __getattr__(self, name: str):
+        attr = getattr(self._client, name)
+        if callable(attr) and (name.startswith('describe_') or name == 'list_tags_for_resource'):
+            return functools.partial(self._cached_call, name, attr)
+        return attr
+    
+    def _cached_call(self, api_name: str, method, **kwargs) -> Dict[str, Any]:
+        """Return a fresh cached response for the call, or make it and store the result."""
+        key = json.dumps([self._scope, api_name, kwargs], sort_keys=True, default=str)
+        path = os.path.join(self._cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+        
+        try:
+            if time.time() - os.path.getmtime(path) < self._ttl:
+                with open(path) as f:
+                    return json.load(f, object_hook=_decode_cached_value)
+        except (OSError, ValueError):
+            pass
+        
+        response = method(**kwargs)
+        
+        # Write to a temp file and rename so concurrent runs never read a partial entry
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(response, f, default=_encode_cached_value)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+        
+        return response
+
+
+class _CachingPaginator:
+    """Paginator stand-in that stores all pages of a describe_* call as one cache entry."""
+    
+    def __init__(self, client: _CachingClient, operation_name: str, paginator):
+        self._client = client
+        self._operation_name = operation_name
+        self._paginator = paginator
+    
+    def paginate(self, **kwargs) -> List[Dict[str, Any]]:
+        """Return every page for the call, from cache when fresh."""
+        return self._client._cached_call(
+            f'paginate:{self._operation_name}',
+            lambda **call_kwargs: list(self._paginator.paginate(**call_kwargs)),
+            **kwargs
+        )
+
 
 class RDSResourceDiscovery:
     """Class to discover and collect RDS-related billable resources."""
     
-    def __init__(self, region_name: str = None, profile_name: str = None):
+    def __init__(self, region_name: str = None, profile_name: str = None,
+                 cache_ttl: float = 0, cache_dir: str = None):
         """
         Initialize the RDS Resource Discovery tool.
         
+        No AWS session is created here: config files and the credential
+        chain are only touched on first use of rds_client, ec2_client or
+        region. Sessions and clients are shared between instances with the
+        same region and profile; set RDS_DISCOVERY_NO_CACHE=1 to always
+        build fresh ones (e.g. when tests patch boto3 per case).
+        
         Args:
             region_name: AWS region name (optional, uses default if not provided)
             profile_name: AWS profile name (optional, uses default if not provided)
+            cache_ttl: Seconds to reuse describe/list-tags responses from disk (0 disables)
+            cache_dir: Directory for cached responses (default: ~/.cache/rds-discovery)
         """
+        self._region_name = region_name
+        self._profile_name = profile_name
+        self._cache_ttl = cache_ttl
+        self._cache_dir = cache_dir
+        self._share_clients = os.environ.get('RDS_DISCOVERY_NO_CACHE') != '1'
+        self._connection = None
+    
+    @property
+    def rds_client(self):
+        """RDS client, created on first access."""
+        return self._connect()[0]
+    
+    @property
+    def ec2_client(self):
+        """EC2 client, created on first access."""
+        return self._connect()[1]
+    
+    @property
+    def region(self) -> Optional[str]:
+        """Effective region name, resolved on first access."""
+        return self._connect()[2]
+    
+    def _connect(self) -> Tuple[Any, Any, Optional[str]]:
+        """Create the session and clients once and return (rds, ec2, region)."""
+        if self._connection is not None:
+            return self._connection
+        
+        region_name = self._region_name
+        profile_name = self._profile_name
         try:
-            session = boto3.Session(profile_name=profile_name)
-            self.rds_client = session.client('rds', region_name=region_name)
-            self.ec2_client = session.client('ec2', region_name=region_name)
-            self.region = region_name or session.region_name
+            if self._share_clients:
+                session = _cached_session(profile_name)
+                rds_client = _cached_client('rds', region_name, profile_name)
+                ec2_client = _cached_client('ec2', region_name, profile_name)
+            else:
+                session = boto3.Session(profile_name=profile_name)
+                rds_client = _BoundedClient(
+                    session.client('rds', region_name=region_name, config=_CLIENT_CONFIG),
+                    _SERVICE_SEMAPHORES['rds']
+                )
+                ec2_client = _BoundedClient(
+                    session.client('ec2', region_name=region_name, config=_CLIENT_CONFIG),
+                    _SERVICE_SEMAPHORES['ec2']
+                )
+            region = region_name or session.region_name
+            
+            if self._cache_ttl > 0:
+                cache_dir = self._cache_dir or DEFAULT_CACHE_DIR
+                rds_client = _CachingClient(
+                    rds_client, ('rds', region, profile_name), cache_dir, self._cache_ttl
+                )
+                ec2_client = _CachingClient(
+                    ec2_client, ('ec2', region, profile_name), cache_dir, self._cache_ttl
+                )
         except NoCredentialsError:
-            print("Error: AWS credentials not found. Please configure your credentials.")
+            logger.error("Error: AWS credentials not found. Please configure your credentials.")
             sys.exit(1)
         except Exception as e:
-            print(f"Error initializing AWS session: {str(e)}")
+            logger.error("Error initializing AWS session: %s", e)
             sys.exit(1)
+        
+        self._connection = (rds_client, ec2_client, region)
+        return self._connection
     
     def get_db_instance_details(self, db_instance_id: str) -> Dict[str, Any]:
         """
@@ -46,41 +305,50 @@ class RDSResourceDiscovery:
         Returns:
             Dictionary containing DB instance details
         """
+        return self._db_instance_details(self._describe_db_instance(db_instance_id))
+    
+    def _describe_db_instance(self, db_instance_id: str) -> Dict[str, Any]:
+        """Return the raw DescribeDBInstances entry, raising ValueError if it does not exist."""
         try:
             response = self.rds_client.describe_db_instances(
                 DBInstanceIdentifier=db_instance_id
             )
-            
-            if not response['DBInstances']:
-                raise ValueError(f"DB Instance {db_instance_id} not found")
-            
-            db_instance = response['DBInstances'][0]
-            
-            return {
-                'db_instance_id': db_instance['DBInstanceIdentifier'],
-                'db_instance_class': db_instance['DBInstanceClass'],
-                'engine': db_instance['Engine'],
-                'engine_version': db_instance['EngineVersion'],
-                'status': db_instance['DBInstanceStatus'],
-                'allocated_storage': db_instance.get('AllocatedStorage', 0),
-                'storage_type': db_instance.get('StorageType', 'N/A'),
-                'storage_encrypted': db_instance.get('StorageEncrypted', False),
-                'availability_zone': db_instance.get('AvailabilityZone', 'N/A'),
-                'multi_az': db_instance.get('MultiAZ', False),
-                'vpc_id': db_instance.get('DBSubnetGroup', {}).get('VpcId', 'N/A'),
-                'subnet_group': db_instance.get('DBSubnetGroup', {}).get('DBSubnetGroupName', 'N/A'),
-                'endpoint': db_instance.get('Endpoint', {}).get('Address', 'N/A'),
-                'port': db_instance.get('Endpoint', {}).get('Port', 'N/A'),
-                'master_username': db_instance.get('MasterUsername', 'N/A'),
-                'db_cluster_identifier': db_instance.get('DBClusterIdentifier', None),
-                'creation_time': db_instance.get('InstanceCreateTime', '').isoformat() if db_instance.get('InstanceCreateTime') else 'N/A',
-                'tags': self._get_resource_tags(db_instance.get('DBInstanceArn', ''))
-            }
         except ClientError as e:
             if e.response['Error']['Code'] == 'DBInstanceNotFoundFault':
                 raise ValueError(f"DB Instance {db_instance_id} not found")
             else:
                 raise e
+        
+        if not response['DBInstances']:
+            raise ValueError(f"DB Instance {db_instance_id} not found")
+        
+        return response['DBInstances'][0]
+    
+    def _db_instance_details(self, db_instance: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the DB instance details dictionary from a raw DescribeDBInstances entry."""
+        subnet_group = db_instance.get('DBSubnetGroup') or {}
+        endpoint = db_instance.get('Endpoint') or {}
+        create_time = db_instance.get('InstanceCreateTime')
+        return {
+            'db_instance_id': db_instance['DBInstanceIdentifier'],
+            'db_instance_class': db_instance['DBInstanceClass'],
+            'engine': db_instance['Engine'],
+            'engine_version': db_instance['EngineVersion'],
+            'status': db_instance['DBInstanceStatus'],
+            'allocated_storage': db_instance.get('AllocatedStorage', 0),
+            'storage_type': db_instance.get('StorageType', 'N/A'),
+            'storage_encrypted': db_instance.get('StorageEncrypted', False),
+            'availability_zone': db_instance.get('AvailabilityZone', 'N/A'),
+            'multi_az': db_instance.get('MultiAZ', False),
+            'vpc_id': subnet_group.get('VpcId', 'N/A'),
+            'subnet_group': subnet_group.get('DBSubnetGroupName', 'N/A'),
+            'endpoint': endpoint.get('Address', 'N/A'),
+            'port': endpoint.get('Port', 'N/A'),
+            'master_username': db_instance.get('MasterUsername', 'N/A'),
+            'db_cluster_identifier': db_instance.get('DBClusterIdentifier', None),
+            'creation_time': create_time.isoformat() if create_time else 'N/A',
+            'tags': self._get_resource_tags(db_instance.get('DBInstanceArn', ''), db_instance.get('TagList'))
+        }
     
     def get_db_cluster_details(self, db_cluster_id: str) -> Dict[str, Any]:
         """
@@ -92,38 +360,70 @@ class RDSResourceDiscovery:
         Returns:
             Dictionary containing DB cluster details
         """
+        return self._db_cluster_details(self._describe_db_cluster(db_cluster_id))
+    
+    def _describe_db_cluster(self, db_cluster_id: str) -> Dict[str, Any]:
+        """Return the raw DescribeDBClusters entry, raising ValueError if it does not exist."""
         try:
             response = self.rds_client.describe_db_clusters(
                 DBClusterIdentifier=db_cluster_id
             )
-            
-            if not response['DBClusters']:
-                raise ValueError(f"DB Cluster {db_cluster_id} not found")
-            
-            db_cluster = response['DBClusters'][0]
-            
-            return {
-                'db_cluster_id': db_cluster['DBClusterIdentifier'],
-                'engine': db_cluster['Engine'],
-                'engine_version': db_cluster['EngineVersion'],
-                'status': db_cluster['Status'],
-                'allocated_storage': db_cluster.get('AllocatedStorage', 0),
-                'storage_encrypted': db_cluster.get('StorageEncrypted', False),
-                'availability_zones': db_cluster.get('AvailabilityZones', []),
-                'vpc_id': db_cluster.get('DBSubnetGroup', 'N/A'),
-                'endpoint': db_cluster.get('Endpoint', 'N/A'),
-                'reader_endpoint': db_cluster.get('ReaderEndpoint', 'N/A'),
-                'port': db_cluster.get('Port', 'N/A'),
-                'master_username': db_cluster.get('MasterUsername', 'N/A'),
-                'cluster_members': [member['DBInstanceIdentifier'] for member in db_cluster.get('DBClusterMembers', [])],
-                'creation_time': db_cluster.get('ClusterCreateTime', '').isoformat() if db_cluster.get('ClusterCreateTime') else 'N/A',
-                'tags': self._get_resource_tags(db_cluster.get('DBClusterArn', ''))
-            }
         except ClientError as e:
             if e.response['Error']['Code'] == 'DBClusterNotFoundFault':
                 raise ValueError(f"DB Cluster {db_cluster_id} not found")
             else:
                 raise e
+        
+        if not response['DBClusters']:
+            raise ValueError(f"DB Cluster {db_cluster_id} not found")
+        
+        return response['DBClusters'][0]
+    
+    def _db_cluster_details(self, db_cluster: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the DB cluster details dictionary from a raw DescribeDBClusters entry."""
+        create_time = db_cluster.get('ClusterCreateTime')
+        return {
+            'db_cluster_id': db_cluster['DBClusterIdentifier'],
+            'engine': db_cluster['Engine'],
+            'engine_version': db_cluster['EngineVersion'],
+            'status': db_cluster['Status'],
+            'allocated_storage': db_cluster.get('AllocatedStorage', 0),
+            'storage_encrypted': db_cluster.get('StorageEncrypted', False),
+            'availability_zones': db_cluster.get('AvailabilityZones', []),
+            'vpc_id': db_cluster.get('DBSubnetGroup', 'N/A'),
+            'endpoint': db_cluster.get('Endpoint', 'N/A'),
+            'reader_endpoint': db_cluster.get('ReaderEndpoint', 'N/A'),
+            'port': db_cluster.get('Port', 'N/A'),
+            'master_username': db_cluster.get('MasterUsername', 'N/A'),
+            'cluster_members': [member['DBInstanceIdentifier'] for member in db_cluster.get('DBClusterMembers', [])],
+            'creation_time': create_time.isoformat() if create_time else 'N/A',
+            'tags': self._get_resource_tags(db_cluster.get('DBClusterArn', ''), db_cluster.get('TagList'))
+        }
+    
+    def _describe_cluster_member_instances(self, db_cluster_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Describe every DB instance in a cluster with one filtered, paginated listing.
+        
+        Args:
+            db_cluster_id: The RDS DB cluster identifier
+            
+        Returns:
+            Raw DescribeDBInstances entries keyed by DB instance identifier
+        """
+        try:
+            paginator = self.rds_client.get_paginator('describe_db_instances')
+            pages = paginator.paginate(
+                Filters=[{'Name': 'db-cluster-id', 'Values': [db_cluster_id]}],
+                PaginationConfig={'PageSize': 100}
+            )
+            return {
+                db_instance['DBInstanceIdentifier']: db_instance
+                for page in pages
+                for db_instance in page['DBInstances']
+            }
+        except ClientError as e:
+            logger.error("Error retrieving DB cluster members: %s", e)
+            return {}
     
     def get_associated_db_snapshots(self, db_instance_id: str) -> List[Dict[str, Any]]:
         """
@@ -136,32 +436,49 @@ class RDSResourceDiscovery:
             List of dictionaries containing DB snapshot details
         """
         snapshots = []
+        untagged = []
+        snapshot_arns = []
         
         try:
-            response = self.rds_client.describe_db_snapshots(
-                DBInstanceIdentifier=db_instance_id
+            # Paginate so instances with more than one page of snapshots are complete
+            paginator = self.rds_client.get_paginator('describe_db_snapshots')
+            pages = paginator.paginate(
+                DBInstanceIdentifier=db_instance_id,
+                PaginationConfig={'PageSize': 100}
             )
             
-            for snapshot in response['DBSnapshots']:
-                snapshot_info = {
-                    'resource_type': 'DB Snapshot',
-                    'resource_id': snapshot['DBSnapshotIdentifier'],
-                    'db_instance_id': snapshot['DBInstanceIdentifier'],
-                    'snapshot_type': snapshot['SnapshotType'],
-                    'status': snapshot['Status'],
-                    'allocated_storage': snapshot.get('AllocatedStorage', 0),
-                    'storage_type': snapshot.get('StorageType', 'N/A'),
-                    'encrypted': snapshot.get('Encrypted', False),
-                    'engine': snapshot.get('Engine', 'N/A'),
-                    'engine_version': snapshot.get('EngineVersion', 'N/A'),
-                    'creation_time': snapshot.get('SnapshotCreateTime', '').isoformat() if snapshot.get('SnapshotCreateTime') else 'N/A',
-                    'availability_zone': snapshot.get('AvailabilityZone', 'N/A'),
-                    'tags': self._get_resource_tags(snapshot.get('DBSnapshotArn', ''))
-                }
-                snapshots.append(snapshot_info)
+            for page in pages:
+                for snapshot in page['DBSnapshots']:
+                    create_time = snapshot.get('SnapshotCreateTime')
+                    snapshot_info = {
+                        'resource_type': 'DB Snapshot',
+                        'resource_id': snapshot['DBSnapshotIdentifier'],
+                        'db_instance_id': snapshot['DBInstanceIdentifier'],
+                        'snapshot_type': snapshot['SnapshotType'],
+                        'status': snapshot['Status'],
+                        'allocated_storage': snapshot.get('AllocatedStorage', 0),
+                        'storage_type': snapshot.get('StorageType', 'N/A'),
+                        'encrypted': snapshot.get('Encrypted', False),
+                        'engine': snapshot.get('Engine', 'N/A'),
+                        'engine_version': snapshot.get('EngineVersion', 'N/A'),
+                        'creation_time': create_time.isoformat() if create_time else 'N/A',
+                        'availability_zone': snapshot.get('AvailabilityZone', 'N/A'),
+                        'tags': {}
+                    }
+                    snapshots.append(snapshot_info)
+                    snapshot_arn = snapshot.get('DBSnapshotArn', '')
+                    if 'TagList' in snapshot:
+                        snapshot_info['tags'] = self._get_resource_tags(snapshot_arn, snapshot['TagList'])
+                    else:
+                        untagged.append(snapshot_info)
+                        snapshot_arns.append(snapshot_arn)
+            
+            # Fetch tags the response did not embed concurrently rather than one by one
+            for snapshot_info, tags in zip(untagged, self._get_resource_tags_many(snapshot_arns)):
+                snapshot_info['tags'] = tags
                 
         except ClientError as e:
-            print(f"Error retrieving DB snapshots: {str(e)}")
+            logger.error("Error retrieving DB snapshots: %s", e)
         
         return snapshots
     
@@ -176,31 +493,48 @@ class RDSResourceDiscovery:
             List of dictionaries containing DB cluster snapshot details
         """
         snapshots = []
+        untagged = []
+        snapshot_arns = []
         
         try:
-            response = self.rds_client.describe_db_cluster_snapshots(
-                DBClusterIdentifier=db_cluster_id
+            # Paginate so clusters with more than one page of snapshots are complete
+            paginator = self.rds_client.get_paginator('describe_db_cluster_snapshots')
+            pages = paginator.paginate(
+                DBClusterIdentifier=db_cluster_id,
+                PaginationConfig={'PageSize': 100}
             )
             
-            for snapshot in response['DBClusterSnapshots']:
-                snapshot_info = {
-                    'resource_type': 'DB Cluster Snapshot',
-                    'resource_id': snapshot['DBClusterSnapshotIdentifier'],
-                    'db_cluster_id': snapshot['DBClusterIdentifier'],
-                    'snapshot_type': snapshot['SnapshotType'],
-                    'status': snapshot['Status'],
-                    'allocated_storage': snapshot.get('AllocatedStorage', 0),
-                    'storage_encrypted': snapshot.get('StorageEncrypted', False),
-                    'engine': snapshot.get('Engine', 'N/A'),
-                    'engine_version': snapshot.get('EngineVersion', 'N/A'),
-                    'creation_time': snapshot.get('SnapshotCreateTime', '').isoformat() if snapshot.get('SnapshotCreateTime') else 'N/A',
-                    'availability_zones': snapshot.get('AvailabilityZones', []),
-                    'tags': self._get_resource_tags(snapshot.get('DBClusterSnapshotArn', ''))
-                }
-                snapshots.append(snapshot_info)
+            for page in pages:
+                for snapshot in page['DBClusterSnapshots']:
+                    create_time = snapshot.get('SnapshotCreateTime')
+                    snapshot_info = {
+                        'resource_type': 'DB Cluster Snapshot',
+                        'resource_id': snapshot['DBClusterSnapshotIdentifier'],
+                        'db_cluster_id': snapshot['DBClusterIdentifier'],
+                        'snapshot_type': snapshot['SnapshotType'],
+                        'status': snapshot['Status'],
+                        'allocated_storage': snapshot.get('AllocatedStorage', 0),
+                        'storage_encrypted': snapshot.get('StorageEncrypted', False),
+                        'engine': snapshot.get('Engine', 'N/A'),
+                        'engine_version': snapshot.get('EngineVersion', 'N/A'),
+                        'creation_time': create_time.isoformat() if create_time else 'N/A',
+                        'availability_zones': snapshot.get('AvailabilityZones', []),
+                        'tags': {}
+                    }
+                    snapshots.append(snapshot_info)
+                    snapshot_arn = snapshot.get('DBClusterSnapshotArn', '')
+                    if 'TagList' in snapshot:
+                        snapshot_info['tags'] = self._get_resource_tags(snapshot_arn, snapshot['TagList'])
+                    else:
+                        untagged.append(snapshot_info)
+                        snapshot_arns.append(snapshot_arn)
+            
+            # Fetch tags the response did not embed concurrently rather than one by one
+            for snapshot_info, tags in zip(untagged, self._get_resource_tags_many(snapshot_arns)):
+                snapshot_info['tags'] = tags
                 
         except ClientError as e:
-            print(f"Error retrieving DB cluster snapshots: {str(e)}")
+            logger.error("Error retrieving DB cluster snapshots: %s", e)
         
         return snapshots
     
@@ -219,14 +553,25 @@ class RDSResourceDiscovery:
         
         # Handle VPC Security Groups
         if vpc_security_groups:
-            sg_ids = [sg['VpcSecurityGroupId'] for sg in vpc_security_groups]
+            sg_ids = [sg['VpcSecurityGroupId'] for sg in vpc_security_groups if sg.get('VpcSecurityGroupId')]
             
             try:
-                response = self.ec2_client.describe_security_groups(
-                    GroupIds=sg_ids
-                )
+                if not sg_ids:
+                    groups = []
+                elif len(sg_ids) > _SG_GROUP_IDS_LIMIT:
+                    # GroupIds is capped per request; a group-id filter pages instead
+                    paginator = self.ec2_client.get_paginator('describe_security_groups')
+                    pages = paginator.paginate(
+                        Filters=[{'Name': 'group-id', 'Values': sg_ids}]
+                    )
+                    groups = [sg for page in pages for sg in page['SecurityGroups']]
+                else:
+                    groups = self.ec2_client.describe_security_groups(
+                        GroupIds=sg_ids
+                    )['SecurityGroups']
                 
-                for sg in response['SecurityGroups']:
+                for sg in groups:
+                    tags = sg.get('Tags') or ()
                     sg_info = {
                         'resource_type': 'VPC Security Group',
                         'resource_id': sg['GroupId'],
@@ -235,12 +580,12 @@ class RDSResourceDiscovery:
                         'vpc_id': sg.get('VpcId', 'N/A'),
                         'inbound_rules': len(sg.get('IpPermissions', [])),
                         'outbound_rules': len(sg.get('IpPermissionsEgress', [])),
-                        'tags': {tag['Key']: tag['Value'] for tag in sg.get('Tags', [])}
+                        'tags': dict(zip((tag['Key'] for tag in tags), (tag['Value'] for tag in tags)))
                     }
                     security_groups.append(sg_info)
                     
             except ClientError as e:
-                print(f"Error retrieving VPC security groups: {str(e)}")
+                logger.error("Error retrieving VPC security groups: %s", e)
         
         # Handle DB Security Groups (EC2-Classic)
         if db_security_groups:
@@ -287,13 +632,13 @@ class RDSResourceDiscovery:
                     'vpc_id': subnet_group['VpcId'],
                     'status': subnet_group['SubnetGroupStatus'],
                     'subnets': [subnet['SubnetIdentifier'] for subnet in subnet_group.get('Subnets', [])],
-                    'availability_zones': list(set([subnet['SubnetAvailabilityZone']['Name'] for subnet in subnet_group.get('Subnets', [])])),
-                    'tags': self._get_resource_tags(subnet_group.get('DBSubnetGroupArn', ''))
+                    'availability_zones': list(dict.fromkeys(subnet['SubnetAvailabilityZone']['Name'] for subnet in subnet_group.get('Subnets', ()))),
+                    'tags': self._get_resource_tags(subnet_group.get('DBSubnetGroupArn', ''), subnet_group.get('TagList'))
                 }
                 subnet_groups.append(subnet_info)
                 
         except ClientError as e:
-            print(f"Error retrieving DB subnet group: {str(e)}")
+            logger.error("Error retrieving DB subnet group: %s", e)
         
         return subnet_groups
     
@@ -307,42 +652,47 @@ class RDSResourceDiscovery:
         Returns:
             List of dictionaries containing parameter group details
         """
+        return self._describe_each(self._describe_parameter_group, parameter_groups)
+    
+    def _describe_parameter_group(self, pg: Dict) -> List[Dict[str, Any]]:
+        """Describe one DB (cluster) parameter group reference, including its tags."""
         param_groups = []
+        param_group_name = pg.get('DBParameterGroupName') or pg.get('DBClusterParameterGroupName')
         
-        for pg in parameter_groups:
-            param_group_name = pg.get('DBParameterGroupName') or pg.get('DBClusterParameterGroupName')
-            
-            if not param_group_name:
-                continue
+        if not param_group_name:
+            return param_groups
+        
+        try:
+            # Determine if it's a cluster parameter group or instance parameter group
+            if 'DBClusterParameterGroupName' in pg:
+                response = self.rds_client.describe_db_cluster_parameter_groups(
+                    DBClusterParameterGroupName=param_group_name
+                )
+                param_group_type = 'DB Cluster Parameter Group'
+                param_groups_list = response['DBClusterParameterGroups']
+            else:
+                response = self.rds_client.describe_db_parameter_groups(
+                    DBParameterGroupName=param_group_name
+                )
+                param_group_type = 'DB Parameter Group'
+                param_groups_list = response['DBParameterGroups']
             
-            try:
-                # Determine if it's a cluster parameter group or instance parameter group
-                if 'DBClusterParameterGroupName' in pg:
-                    response = self.rds_client.describe_db_cluster_parameter_groups(
-                        DBClusterParameterGroupName=param_group_name
-                    )
-                    param_group_type = 'DB Cluster Parameter Group'
-                    param_groups_list = response['DBClusterParameterGroups']
-                else:
-                    response = self.rds_client.describe_db_parameter_groups(
-                        DBParameterGroupName=param_group_name
+            for param_group in param_groups_list:
+                pg_info = {
+                    'resource_type': param_group_type,
+                    'resource_id': param_group_name,
+                    'name': param_group_name,
+                    'family': param_group.get('DBParameterGroupFamily') or param_group.get('DBClusterParameterGroupFamily'),
+                    'description': param_group['Description'],
+                    'tags': self._get_resource_tags(
+                        param_group.get('DBParameterGroupArn') or param_group.get('DBClusterParameterGroupArn', ''),
+                        param_group.get('TagList')
                     )
-                    param_group_type = 'DB Parameter Group'
-                    param_groups_list = response['DBParameterGroups']
-                
-                for param_group in param_groups_list:
-                    pg_info = {
-                        'resource_type': param_group_type,
-                        'resource_id': param_group_name,
-                        'name': param_group_name,
-                        'family': param_group.get('DBParameterGroupFamily') or param_group.get('DBClusterParameterGroupFamily'),
-                        'description': param_group['Description'],
-                        'tags': self._get_resource_tags(param_group.get('DBParameterGroupArn') or param_group.get('DBClusterParameterGroupArn', ''))
-                    }
-                    param_groups.append(pg_info)
-                    
-            except ClientError as e:
-                print(f"Error retrieving parameter group {param_group_name}: {str(e)}")
+                }
+                param_groups.append(pg_info)
+            
+        except ClientError as e:
+            logger.error("Error retrieving parameter group %s: %s", param_group_name, e)
         
         return param_groups
     
@@ -356,48 +706,80 @@ class RDSResourceDiscovery:
         Returns:
             List of dictionaries containing option group details
         """
+        return self._describe_each(self._describe_option_group, option_groups)
+    
+    def _describe_option_group(self, og: Dict) -> List[Dict[str, Any]]:
+        """Describe one option group membership, including its tags."""
         opt_groups = []
+        option_group_name = og.get('OptionGroupName') or og.get('DBClusterOptionGroupName')
+        
+        if not option_group_name:
+            return opt_groups
         
-        for og in option_groups:
-            option_group_name = og.get('OptionGroupName') or og.get('DBClusterOptionGroupName')
+        try:
+            response = self.rds_client.describe_option_groups(
+                OptionGroupName=option_group_name
+            )
             
-            if not option_group_name:
-                continue
+            for option_group in response['OptionGroupsList']:
+                og_info = {
+                    'resource_type': 'Option Group',
+                    'resource_id': option_group_name,
+                    'name': option_group_name,
+                    'description': option_group['OptionGroupDescription'],
+                    'engine_name': option_group['EngineName'],
+                    'major_engine_version': option_group['MajorEngineVersion'],
+                    'vpc_id': option_group.get('VpcId', 'N/A'),
+                    'options': [option['OptionName'] for option in option_group.get('Options', [])],
+                    'tags': self._get_resource_tags(option_group.get('OptionGroupArn', ''), option_group.get('TagList'))
+                }
+                opt_groups.append(og_info)
             
-            try:
-                response = self.rds_client.describe_option_groups(
-                    OptionGroupName=option_group_name
-                )
-                
-                for option_group in response['OptionGroupsList']:
-                    og_info = {
-                        'resource_type': 'Option Group',
-                        'resource_id': option_group_name,
-                        'name': option_group_name,
-                        'description': option_group['OptionGroupDescription'],
-                        'engine_name': option_group['EngineName'],
-                        'major_engine_version': option_group['MajorEngineVersion'],
-                        'vpc_id': option_group.get('VpcId', 'N/A'),
-                        'options': [option['OptionName'] for option in option_group.get('Options', [])],
-                        'tags': self._get_resource_tags(option_group.get('OptionGroupArn', ''))
-                    }
-                    opt_groups.append(og_info)
-                    
-            except ClientError as e:
-                print(f"Error retrieving option group {option_group_name}: {str(e)}")
+        except ClientError as e:
+            logger.error("Error retrieving option group %s: %s", option_group_name, e)
         
         return opt_groups
     
-    def _get_resource_tags(self, resource_arn: str) -> Dict[str, str]:
+    def _describe_each(self, describe, refs: List[Dict]) -> List[Dict[str, Any]]:
+        """
+        Run a per-group describe function over every reference concurrently.
+        
+        Each worker covers the describe call and the tag lookup for its group,
+        so tags for one group are fetched while the next is being described.
+        
+        Args:
+            describe: Function mapping one reference to a list of resource dicts
+            refs: Group references from the DB instance/cluster
+            
+        Returns:
+            Flattened list of resource dicts, in the order of refs
+        """
+        if not refs:
+            return []
+        if len(refs) == 1:
+            return describe(refs[0])
+        
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(refs))) as executor:
+            return [item for items in executor.map(describe, refs) for item in items]
+    
+    def _get_resource_tags(self, resource_arn: str,
+                           embedded_taglist: Optional[List[Dict[str, str]]] = None) -> Dict[str, str]:
         """
         Get tags for a resource using its ARN.
         
+        Describe responses usually embed the resource's TagList already; when
+        it is passed in, no list_tags_for_resource call is made.
+        
         Args:
             resource_arn: The ARN of the resource
+            embedded_taglist: TagList from the describe response, if present
             
         Returns:
             Dictionary of tags
         """
+        if embedded_taglist is not None:
+            return {tag['Key']: tag['Value'] for tag in embedded_taglist}
+        
         if not resource_arn:
             return {}
         
@@ -405,9 +787,42 @@ class RDSResourceDiscovery:
             response = self.rds_client.list_tags_for_resource(
                 ResourceName=resource_arn
             )
-            return {tag['Key']: tag['Value'] for tag in response.get('TagList', [])}
         except ClientError:
             return {}
+        
+        return {tag['Key']: tag['Value'] for tag in response.get('TagList', [])}
+    
+    def _get_resource_tags_many(self, resource_arns: List[str]) -> List[Dict[str, str]]:
+        """
+        Get tags for several resources, issuing the lookups concurrently.
+        
+        Args:
+            resource_arns: ARNs of the resources
+            
+        Returns:
+            List of tag dictionaries, in the same order as resource_arns
+        """
+        if len(resource_arns) <= 1:
+            return [self._get_resource_tags(arn) for arn in resource_arns]
+        
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(resource_arns))) as executor:
+            return list(executor.map(self._get_resource_tags, resource_arns))
+    
+    @staticmethod
+    def to_json(discovery_result: Dict[str, Any]) -> str:
+        """
+        Serialize a discovery result to a JSON string.
+        
+        Uses orjson when it is installed and falls back to the json module;
+        datetimes are written as ISO 8601 strings either way.
+        
+        Args:
+            discovery_result: Result from resource discovery
+            
+        Returns:
+            JSON document as a string
+        """
+        return rds_json.dumps(discovery_result).decode('utf-8')
     
     def discover_db_instance_resources(self, db_instance_id: str) -> Dict[str, Any]:
         """
@@ -419,14 +834,13 @@ class RDSResourceDiscovery:
         Returns:
             Dictionary containing all discovered resources
         """
-        print(f"Discovering resources for RDS DB instance: {db_instance_id}")
+        logger.info("Discovering resources for RDS DB instance: %s", db_instance_id)
         
         try:
-            # Get DB instance details first to validate it exists
-            instance_details = self.get_db_instance_details(db_instance_id)
-            
-            # Discover all associated resources
-            all_resources = []
+            # Describe the DB instance once: validates it exists and carries
+            # the references to every associated resource
+            db_instance = self._describe_db_instance(db_instance_id)
+            instance_details = self._db_instance_details(db_instance)
             
             # Add DB instance itself as a resource
             instance_resource = {
@@ -446,28 +860,37 @@ class RDSResourceDiscovery:
                 'port': instance_details['port'],
                 'tags': instance_details['tags']
             }
-            all_resources.append(instance_resource)
             
-            # Get the full DB instance details for extracting associated resources
-            response = self.rds_client.describe_db_instances(DBInstanceIdentifier=db_instance_id)
-            db_instance = response['DBInstances'][0]
+            # Discover associated resources; the lookups are independent
+            # round-trips, so run them concurrently on the shared clients
+            with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+                snapshots_future = executor.submit(self.get_associated_db_snapshots, db_instance_id)
+                security_groups_future = executor.submit(
+                    self.get_associated_security_groups,
+                    db_instance.get('VpcSecurityGroups', []),
+                    db_instance.get('DBSecurityGroups', [])
+                )
+                subnet_groups_future = executor.submit(
+                    self.get_associated_subnet_group, instance_details['subnet_group']
+                )
+                parameter_groups_future = executor.submit(
+                    self.get_associated_parameter_groups, db_instance.get('DBParameterGroups', [])
+                )
+                option_groups_future = executor.submit(
+                    self.get_associated_option_groups, db_instance.get('OptionGroupMemberships', [])
+                )
             
-            # Discover associated resources
-            snapshots = self.get_associated_db_snapshots(db_instance_id)
-            security_groups = self.get_associated_security_groups(
-                db_instance.get('VpcSecurityGroups', []),
-                db_instance.get('DBSecurityGroups', [])
-            )
-            subnet_groups = self.get_associated_subnet_group(instance_details['subnet_group'])
-            parameter_groups = self.get_associated_parameter_groups(db_instance.get('DBParameterGroups', []))
-            option_groups = self.get_associated_option_groups(db_instance.get('OptionGroupMemberships', []))
+            snapshots = snapshots_future.result()
+            security_groups = security_groups_future.result()
+            subnet_groups = subnet_groups_future.result()
+            parameter_groups = parameter_groups_future.result()
+            option_groups = option_groups_future.result()
             
-            # Combine all resources
-            all_resources.extend(snapshots)
-            all_resources.extend(security_groups)
-            all_resources.extend(subnet_groups)
-            all_resources.extend(parameter_groups)
-            all_resources.extend(option_groups)
+            # Combine all resources in a single pass
+            all_resources = list(itertools.chain(
+                (instance_resource,), snapshots, security_groups,
+                subnet_groups, parameter_groups, option_groups
+            ))
             
             return {
                 'resource_type': 'db_instance',
@@ -484,10 +907,10 @@ class RDSResourceDiscovery:
             }
             
         except ValueError as e:
-            print(f"Error: {str(e)}")
+            logger.error("Error: %s", e)
             return None
         except Exception as e:
-            print(f"Unexpected error: {str(e)}")
+            logger.error("Unexpected error: %s", e)
             return None
     
     def discover_db_cluster_resources(self, db_cluster_id: str) -> Dict[str, Any]:
@@ -500,14 +923,13 @@ class RDSResourceDiscovery:
         Returns:
             Dictionary containing all discovered resources
         """
-        print(f"Discovering resources for RDS DB cluster: {db_cluster_id}")
+        logger.info("Discovering resources for RDS DB cluster: %s", db_cluster_id)
         
         try:
-            # Get DB cluster details first to validate it exists
-            cluster_details = self.get_db_cluster_details(db_cluster_id)
-            
-            # Discover all associated resources
-            all_resources = []
+            # Describe the DB cluster once: validates it exists and carries
+            # the references to every associated resource
+            db_cluster = self._describe_db_cluster(db_cluster_id)
+            cluster_details = self._db_cluster_details(db_cluster)
             
             # Add DB cluster itself as a resource
             cluster_resource = {
@@ -526,31 +948,53 @@ class RDSResourceDiscovery:
                 'cluster_members': cluster_details['cluster_members'],
                 'tags': cluster_details['tags']
             }
-            all_resources.append(cluster_resource)
-            
-            # Get the full DB cluster details for extracting associated resources
-            response = self.rds_client.describe_db_clusters(DBClusterIdentifier=db_cluster_id)
-            db_cluster = response['DBClusters'][0]
-            
-            # Discover associated resources
-            cluster_snapshots = self.get_associated_db_cluster_snapshots(db_cluster_id)
-            security_groups = self.get_associated_security_groups(db_cluster.get('VpcSecurityGroups', []))
-            subnet_groups = self.get_associated_subnet_group(db_cluster.get('DBSubnetGroup', ''))
             
             # For clusters, parameter groups are handled differently
-            cluster_param_groups = []
+            cluster_param_group_refs = []
             if db_cluster.get('DBClusterParameterGroup'):
-                cluster_param_groups = self.get_associated_parameter_groups([{
+                cluster_param_group_refs = [{
                     'DBClusterParameterGroupName': db_cluster['DBClusterParameterGroup']
-                }])
+                }]
             
-            cluster_option_groups = self.get_associated_option_groups(db_cluster.get('DBClusterOptionGroupMemberships', []))
+            members = db_cluster.get('DBClusterMembers', [])
+            
+            # Discover associated resources and cluster member details concurrently
+            with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+                cluster_snapshots_future = executor.submit(
+                    self.get_associated_db_cluster_snapshots, db_cluster_id
+                )
+                security_groups_future = executor.submit(
+                    self.get_associated_security_groups, db_cluster.get('VpcSecurityGroups', [])
+                )
+                subnet_groups_future = executor.submit(
+                    self.get_associated_subnet_group, db_cluster.get('DBSubnetGroup', '')
+                )
+                cluster_param_groups_future = executor.submit(
+                    self.get_associated_parameter_groups, cluster_param_group_refs
+                )
+                cluster_option_groups_future = executor.submit(
+                    self.get_associated_option_groups, db_cluster.get('DBClusterOptionGroupMemberships', [])
+                )
+                # One filtered listing covers every member instead of a describe per member
+                members_future = executor.submit(
+                    self._describe_cluster_member_instances, db_cluster_id
+                ) if members else None
+            
+            cluster_snapshots = cluster_snapshots_future.result()
+            security_groups = security_groups_future.result()
+            subnet_groups = subnet_groups_future.result()
+            cluster_param_groups = cluster_param_groups_future.result()
+            cluster_option_groups = cluster_option_groups_future.result()
+            members_by_id = members_future.result() if members_future else {}
             
             # Get cluster member instances
             member_instances = []
-            for member in db_cluster.get('DBClusterMembers', []):
+            for member in members:
                 try:
-                    member_details = self.get_db_instance_details(member['DBInstanceIdentifier'])
+                    member_instance = members_by_id.get(member['DBInstanceIdentifier'])
+                    if member_instance is None:
+                        raise ValueError(f"DB Instance {member['DBInstanceIdentifier']} not found")
+                    member_details = self._db_instance_details(member_instance)
                     member_resource = {
                         'resource_type': 'DB Cluster Member',
                         'resource_id': member['DBInstanceIdentifier'],
@@ -564,15 +1008,13 @@ class RDSResourceDiscovery:
                     }
                     member_instances.append(member_resource)
                 except Exception as e:
-                    print(f"Error getting details for cluster member {member['DBInstanceIdentifier']}: {str(e)}")
+                    logger.error("Error getting details for cluster member %s: %s", member['DBInstanceIdentifier'], e)
             
-            # Combine all resources
-            all_resources.extend(cluster_snapshots)
-            all_resources.extend(security_groups)
-            all_resources.extend(subnet_groups)
-            all_resources.extend(cluster_param_groups)
-            all_resources.extend(cluster_option_groups)
-            all_resources.extend(member_instances)
+            # Combine all resources in a single pass
+            all_resources = list(itertools.chain(
+                (cluster_resource,), cluster_snapshots, security_groups, subnet_groups,
+                cluster_param_groups, cluster_option_groups, member_instances
+            ))
             
             return {
                 'resource_type': 'db_cluster',
@@ -590,30 +1032,49 @@ class RDSResourceDiscovery:
             }
             
         except ValueError as e:
-            print(f"Error: {str(e)}")
+            logger.error("Error: %s", e)
             return None
         except Exception as e:
-            print(f"Unexpected error: {str(e)}")
+            logger.error("Unexpected error: %s", e)
             return None
 
 
-def main():
-    """Main function to run the resource discovery tool."""
-    if len(sys.argv) < 2:
-        print("Usage: python rds_resource_discovery.py <db-instance-id|db-cluster-id> [--cluster] [region] [profile]")
-        print("Examples:")
-        print("  python rds_resource_discovery.py my-db-instance")
-        print("  python rds_resource_discovery.py my-db-cluster --cluster")
-        print("  python rds_resource_discovery.py my-db-instance us-east-1 default")
-        sys.exit(1)
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser once per process."""
+    parser = argparse.ArgumentParser(
+        description='Discover billable resources associated with an RDS DB instance or DB cluster',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python rds_resource_discovery.py my-db-instance
+  python rds_resource_discovery.py my-db-cluster --cluster
+  python rds_resource_discovery.py my-db-instance us-east-1 default"""
+    )
+    parser.add_argument('identifier', help='RDS DB instance identifier or DB cluster identifier')
+    parser.add_argument('--cluster', action='store_true', help='Treat the identifier as a DB cluster identifier')
+    parser.add_argument('region', nargs='?', help='AWS region name (optional)')
+    parser.add_argument('profile', nargs='?', help='AWS profile name (optional)')
+    return parser
+
+
+def main(args: Optional[argparse.Namespace] = None):
+    """
+    Main function to run the resource discovery tool.
+    
+    Args:
+        args: Pre-parsed arguments; parsed from sys.argv when omitted
+    """
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     
-    identifier = sys.argv[1]
-    is_cluster = '--cluster' in sys.argv
+    if args is None:
+        # Intermixed parsing keeps --cluster valid anywhere, as with the old argv scan
+        args = _build_parser().parse_intermixed_args()
     
-    # Remove --cluster from args to get region and profile
-    args = [arg for arg in sys.argv[2:] if arg != '--cluster']
-    region = args[0] if len(args) > 0 else None
-    profile = args[1] if len(args) > 1 else None
+    identifier = args.identifier
+    is_cluster = args.cluster
+    region = args.region
+    profile = args.profile
     
     # Initialize the discovery tool
     discovery = RDSResourceDiscovery(region_name=region, profile_name=profile)
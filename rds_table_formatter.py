@@ -5,10 +5,178 @@ Table Formatter for AWS RDS Resource Discovery
 This module provides functions to format the discovered AWS RDS resources into various table formats.
 """
 
-import pandas as pd
-from tabulate import tabulate
-import json
-from typing import Dict, List, Any, Optional
+import csv
+import io
+import sys
+from collections import defaultdict
+from itertools import islice
+from operator import itemgetter, methodcaller
+from typing import Callable, Dict, List, Any, Optional, Iterator, Sequence, TextIO, Tuple, Union
+
+import rds_json
+
+# tabulate is imported inside the table methods, so CSV/JSON-only use never loads it
+
+
+ColumnSpec = Tuple[Tuple[str, Callable[[Dict[str, Any]], Any]], ...]
+
+
+def _field(key: str) -> Callable[[Dict[str, Any]], Any]:
+    """Getter for a plain resource field, defaulting to 'N/A'."""
+    return methodcaller('get', key, 'N/A')
+
+
+def _joined(key: str) -> Callable[[Dict[str, Any]], str]:
+    """Getter that joins a list field with commas."""
+    return lambda resource: ', '.join(resource.get(key, []))
+
+
+def _truncate(text: Optional[str], limit: int = 40) -> str:
+    """Cut text to limit characters with an ellipsis; empty or missing text becomes 'N/A'."""
+    if not text:
+        return 'N/A'
+    return text[:limit] + '...' if len(text) > limit else text
+
+
+def _description(resource: Dict[str, Any]) -> str:
+    """Getter for the description, truncated to 40 characters."""
+    return _truncate(resource.get('description'))
+
+
+def _creation_time(resource: Dict[str, Any]) -> str:
+    """Getter for the creation time, trimmed to whole seconds."""
+    creation_time = resource.get('creation_time')
+    return creation_time[:19] if creation_time else 'N/A'
+
+
+def _subnets(resource: Dict[str, Any]) -> str:
+    """Getter listing the first three subnets."""
+    return ', '.join(resource.get('subnets', [])[:3]) + ('...' if len(resource.get('subnets', [])) > 3 else '')
+
+
+# Common fields already shown in their own columns of the simple and generic tables
+_DETAIL_SKIP = frozenset({'resource_type', 'resource_id', 'tags'})
+
+# Borderless format used by the fast=True rendering path
+_FAST_TABLE_FORMAT = 'plain'
+
+_SUMMARY_HEADERS = ('Resource Type', 'Count')
+
+# Column specs for the detailed per-type tables: (header, getter) in display
+# order. A Tags column is appended to every table except DB security groups.
+# resource_id is set on every discovered resource, so it is read by subscript.
+_DB_INSTANCE_COLS: ColumnSpec = (
+    ('DB Instance ID', itemgetter('resource_id')),
+    ('Instance Class', _field('db_instance_class')),
+    ('Engine', _field('engine')),
+    ('Engine Version', _field('engine_version')),
+    ('Status', _field('status')),
+    ('Storage (GB)', _field('allocated_storage')),
+    ('Storage Type', _field('storage_type')),
+    ('Encrypted', _field('storage_encrypted')),
+    ('Multi-AZ', _field('multi_az')),
+    ('AZ', _field('availability_zone')),
+    ('VPC ID', _field('vpc_id')),
+    ('Endpoint', _field('endpoint')),
+    ('Port', _field('port')),
+)
+
+_DB_CLUSTER_COLS: ColumnSpec = (
+    ('DB Cluster ID', itemgetter('resource_id')),
+    ('Engine', _field('engine')),
+    ('Engine Version', _field('engine_version')),
+    ('Status', _field('status')),
+    ('Storage (GB)', _field('allocated_storage')),
+    ('Encrypted', _field('storage_encrypted')),
+    ('Availability Zones', _joined('availability_zones')),
+    ('VPC ID', _field('vpc_id')),
+    ('Endpoint', _field('endpoint')),
+    ('Reader Endpoint', _field('reader_endpoint')),
+    ('Port', _field('port')),
+    ('Members', _joined('cluster_members')),
+)
+
+_DB_CLUSTER_MEMBER_COLS: ColumnSpec = (
+    ('Instance ID', itemgetter('resource_id')),
+    ('Instance Class', _field('db_instance_class')),
+    ('Engine', _field('engine')),
+    ('Status', _field('status')),
+    ('Is Writer', _field('is_cluster_writer')),
+    ('Promotion Tier', _field('promotion_tier')),
+    ('Availability Zone', _field('availability_zone')),
+)
+
+_DB_SNAPSHOT_COLS: ColumnSpec = (
+    ('Snapshot ID', itemgetter('resource_id')),
+    ('DB Instance ID', _field('db_instance_id')),
+    ('Type', _field('snapshot_type')),
+    ('Status', _field('status')),
+    ('Storage (GB)', _field('allocated_storage')),
+    ('Storage Type', _field('storage_type')),
+    ('Encrypted', _field('encrypted')),
+    ('Engine', _field('engine')),
+    ('Creation Time', _creation_time),
+    ('AZ', _field('availability_zone')),
+)
+
+_DB_CLUSTER_SNAPSHOT_COLS: ColumnSpec = (
+    ('Snapshot ID', itemgetter('resource_id')),
+    ('DB Cluster ID', _field('db_cluster_id')),
+    ('Type', _field('snapshot_type')),
+    ('Status', _field('status')),
+    ('Storage (GB)', _field('allocated_storage')),
+    ('Encrypted', _field('storage_encrypted')),
+    ('Engine', _field('engine')),
+    ('Creation Time', _creation_time),
+    ('Availability Zones', _joined('availability_zones')),
+)
+
+_VPC_SECURITY_GROUP_COLS: ColumnSpec = (
+    ('Security Group ID', itemgetter('resource_id')),
+    ('Name', _field('name')),
+    ('Description', _description),
+    ('VPC ID', _field('vpc_id')),
+    ('Inbound Rules', _field('inbound_rules')),
+    ('Outbound Rules', _field('outbound_rules')),
+)
+
+_DB_SECURITY_GROUP_COLS: ColumnSpec = (
+    ('DB Security Group', itemgetter('resource_id')),
+    ('Name', _field('name')),
+    ('Description', _field('description')),
+    ('Status', _field('status')),
+    ('VPC', _field('vpc_id')),
+)
+
+_DB_SUBNET_GROUP_COLS: ColumnSpec = (
+    ('Subnet Group Name', itemgetter('resource_id')),
+    ('Description', _description),
+    ('VPC ID', _field('vpc_id')),
+    ('Status', _field('status')),
+    ('Subnets', _subnets),
+    ('Availability Zones', _joined('availability_zones')),
+)
+
+_DB_PARAMETER_GROUP_COLS: ColumnSpec = (
+    ('Parameter Group Name', itemgetter('resource_id')),
+    ('Family', _field('family')),
+    ('Description', _description),
+)
+
+_DB_CLUSTER_PARAMETER_GROUP_COLS: ColumnSpec = (
+    ('Cluster Parameter Group', itemgetter('resource_id')),
+    ('Family', _field('family')),
+    ('Description', _description),
+)
+
+_OPTION_GROUP_COLS: ColumnSpec = (
+    ('Option Group Name', itemgetter('resource_id')),
+    ('Description', _description),
+    ('Engine', _field('engine_name')),
+    ('Engine Version', _field('major_engine_version')),
+    ('VPC ID', _field('vpc_id')),
+    ('Options', _joined('options')),
+)
 
 
 class RDSResourceTableFormatter:
@@ -16,16 +184,30 @@ class RDSResourceTableFormatter:
     
     def __init__(self):
         """Initialize the table formatter."""
-        pass
+        # Detailed-table formatter per resource type; others use the generic table
+        self._dispatch = {
+            'DB Instance': self._format_db_instances_table,
+            'DB Cluster': self._format_db_clusters_table,
+            'DB Cluster Member': self._format_db_cluster_members_table,
+            'DB Snapshot': self._format_db_snapshots_table,
+            'DB Cluster Snapshot': self._format_db_cluster_snapshots_table,
+            'VPC Security Group': self._format_vpc_security_groups_table,
+            'DB Security Group': self._format_db_security_groups_table,
+            'DB Subnet Group': self._format_db_subnet_groups_table,
+            'DB Parameter Group': self._format_db_parameter_groups_table,
+            'DB Cluster Parameter Group': self._format_db_cluster_parameter_groups_table,
+            'Option Group': self._format_option_groups_table,
+        }
     
     def format_resources_table(self, resources: List[Dict[str, Any]], 
-                             table_format: str = "grid") -> str:
+                             table_format: str = "grid", fast: bool = False) -> str:
         """
         Format the list of resources into a table.
         
         Args:
             resources: List of resource dictionaries
             table_format: Table format for tabulate (grid, simple, fancy_grid, etc.)
+            fast: Render borderless plain tables, the cheapest tabulate format (overrides table_format)
             
         Returns:
             Formatted table as string
@@ -33,6 +215,9 @@ class RDSResourceTableFormatter:
         if not resources:
             return "No resources found."
         
+        if fast:
+            table_format = _FAST_TABLE_FORMAT
+        
         # Create a list to hold table rows
         table_data = []
         
@@ -45,291 +230,162 @@ class RDSResourceTableFormatter:
             }
             table_data.append(row)
         
-        # Convert to DataFrame for better handling
-        df = pd.DataFrame(table_data)
+        from tabulate import tabulate
         
-        # Use tabulate to create the table
-        return tabulate(df, headers='keys', tablefmt=table_format, showindex=False)
+        # tabulate renders the row dicts directly, keyed by column header
+        return tabulate(table_data, headers='keys', tablefmt=table_format)
     
     def format_detailed_resources_table(self, resources: List[Dict[str, Any]], 
-                                      table_format: str = "grid") -> str:
+                                      table_format: str = "grid", fast: bool = False) -> str:
         """
         Format resources into a detailed table with separate columns for key attributes.
         
         Args:
             resources: List of resource dictionaries
             table_format: Table format for tabulate
+            fast: Render borderless plain tables, the cheapest tabulate format (overrides table_format)
             
         Returns:
             Formatted detailed table as string
         """
-        if not resources:
-            return "No resources found."
+        # Write each per-type table into one buffer as it is rendered instead of
+        # keeping them all for a final join
+        buffer = io.StringIO()
+        self.format_detailed_resources_stream(resources, table_format, buffer, fast=fast)
+        return buffer.getvalue()
+    
+    def format_detailed_resources_stream(self, resources: List[Dict[str, Any]], 
+                                         table_format: str = "grid",
+                                         out: Optional[TextIO] = None,
+                                         fast: bool = False) -> None:
+        """
+        Write the detailed tables to a stream as each resource type is rendered.
+        
+        Produces the same text as format_detailed_resources_table() without
+        holding every per-type table in memory at once.
+        
+        Args:
+            resources: List of resource dictionaries
+            table_format: Table format for tabulate
+            out: Text stream to write to (default: the current sys.stdout)
+            fast: Render borderless plain tables, the cheapest tabulate format (overrides table_format)
+        """
+        if out is None:
+            # Looked up per call so redirect_stdout and test capture are honoured
+            out = sys.stdout
         
+        if not resources:
+            out.write("No resources found.")
+            return
+        
+        if fast:
+            table_format = _FAST_TABLE_FORMAT
+        
+        # Groups are only created when a resource is appended, so none is empty;
+        # the separator and heading go out in a single write per table
+        separator = ''
+        for resource_type, table in self._iter_detailed_tables(resources, table_format):
+            out.write(f"{separator}\n## {resource_type}s\n\n")
+            out.write(table)
+            separator = '\n'
+    
+    def _iter_detailed_tables(self, resources: List[Dict[str, Any]], 
+                              table_format: str) -> Iterator[Tuple[str, str]]:
+        """Yield (resource type, formatted table) pairs, one per resource type."""
         # Group resources by type for better organization
-        resource_groups = {}
+        resource_groups = defaultdict(list)
         for resource in resources:
-            resource_type = resource.get('resource_type', 'Unknown')
-            if resource_type not in resource_groups:
-                resource_groups[resource_type] = []
-            resource_groups[resource_type].append(resource)
+            resource_groups[resource.get('resource_type', 'Unknown')].append(resource)
         
         # Create separate tables for each resource type
-        formatted_tables = []
-        
         for resource_type, resource_list in resource_groups.items():
-            formatted_tables.append(f"\n## {resource_type}s\n")
-            
-            if resource_type == 'DB Instance':
-                table = self._format_db_instances_table(resource_list, table_format)
-            elif resource_type == 'DB Cluster':
-                table = self._format_db_clusters_table(resource_list, table_format)
-            elif resource_type == 'DB Cluster Member':
-                table = self._format_db_cluster_members_table(resource_list, table_format)
-            elif resource_type == 'DB Snapshot':
-                table = self._format_db_snapshots_table(resource_list, table_format)
-            elif resource_type == 'DB Cluster Snapshot':
-                table = self._format_db_cluster_snapshots_table(resource_list, table_format)
-            elif resource_type == 'VPC Security Group':
-                table = self._format_vpc_security_groups_table(resource_list, table_format)
-            elif resource_type == 'DB Security Group':
-                table = self._format_db_security_groups_table(resource_list, table_format)
-            elif resource_type == 'DB Subnet Group':
-                table = self._format_db_subnet_groups_table(resource_list, table_format)
-            elif resource_type == 'DB Parameter Group':
-                table = self._format_db_parameter_groups_table(resource_list, table_format)
-            elif resource_type == 'DB Cluster Parameter Group':
-                table = self._format_db_cluster_parameter_groups_table(resource_list, table_format)
-            elif resource_type == 'Option Group':
-                table = self._format_option_groups_table(resource_list, table_format)
-            else:
-                table = self._format_generic_table(resource_list, table_format)
-            
-            formatted_tables.append(table)
-        
-        return '\n'.join(formatted_tables)
+            format_table = self._dispatch.get(resource_type, self._format_generic_table)
+            yield resource_type, format_table(resource_list, table_format)
     
     def _format_db_instances_table(self, instances: List[Dict[str, Any]], 
                                  table_format: str) -> str:
         """Format DB instances into a table."""
-        table_data = []
-        for instance in instances:
-            row = {
-                'DB Instance ID': instance.get('resource_id', 'N/A'),
-                'Instance Class': instance.get('db_instance_class', 'N/A'),
-                'Engine': instance.get('engine', 'N/A'),
-                'Engine Version': instance.get('engine_version', 'N/A'),
-                'Status': instance.get('status', 'N/A'),
-                'Storage (GB)': instance.get('allocated_storage', 'N/A'),
-                'Storage Type': instance.get('storage_type', 'N/A'),
-                'Encrypted': instance.get('storage_encrypted', 'N/A'),
-                'Multi-AZ': instance.get('multi_az', 'N/A'),
-                'AZ': instance.get('availability_zone', 'N/A'),
-                'VPC ID': instance.get('vpc_id', 'N/A'),
-                'Endpoint': instance.get('endpoint', 'N/A'),
-                'Port': instance.get('port', 'N/A'),
-                'Tags': self._format_tags(instance.get('tags', {}))
-            }
-            table_data.append(row)
-        
-        df = pd.DataFrame(table_data)
-        return tabulate(df, headers='keys', tablefmt=table_format, showindex=False)
+        return self._tabulate_columns(instances, _DB_INSTANCE_COLS, table_format)
     
     def _format_db_clusters_table(self, clusters: List[Dict[str, Any]], 
                                 table_format: str) -> str:
         """Format DB clusters into a table."""
-        table_data = []
-        for cluster in clusters:
-            row = {
-                'DB Cluster ID': cluster.get('resource_id', 'N/A'),
-                'Engine': cluster.get('engine', 'N/A'),
-                'Engine Version': cluster.get('engine_version', 'N/A'),
-                'Status': cluster.get('status', 'N/A'),
-                'Storage (GB)': cluster.get('allocated_storage', 'N/A'),
-                'Encrypted': cluster.get('storage_encrypted', 'N/A'),
-                'Availability Zones': ', '.join(cluster.get('availability_zones', [])),
-                'VPC ID': cluster.get('vpc_id', 'N/A'),
-                'Endpoint': cluster.get('endpoint', 'N/A'),
-                'Reader Endpoint': cluster.get('reader_endpoint', 'N/A'),
-                'Port': cluster.get('port', 'N/A'),
-                'Members': ', '.join(cluster.get('cluster_members', [])),
-                'Tags': self._format_tags(cluster.get('tags', {}))
-            }
-            table_data.append(row)
-        
-        df = pd.DataFrame(table_data)
-        return tabulate(df, headers='keys', tablefmt=table_format, showindex=False)
+        return self._tabulate_columns(clusters, _DB_CLUSTER_COLS, table_format)
     
     def _format_db_cluster_members_table(self, members: List[Dict[str, Any]], 
                                        table_format: str) -> str:
         """Format DB cluster members into a table."""
-        table_data = []
-        for member in members:
-            row = {
-                'Instance ID': member.get('resource_id', 'N/A'),
-                'Instance Class': member.get('db_instance_class', 'N/A'),
-                'Engine': member.get('engine', 'N/A'),
-                'Status': member.get('status', 'N/A'),
-                'Is Writer': member.get('is_cluster_writer', 'N/A'),
-                'Promotion Tier': member.get('promotion_tier', 'N/A'),
-                'Availability Zone': member.get('availability_zone', 'N/A'),
-                'Tags': self._format_tags(member.get('tags', {}))
-            }
-            table_data.append(row)
-        
-        df = pd.DataFrame(table_data)
-        return tabulate(df, headers='keys', tablefmt=table_format, showindex=False)
+        return self._tabulate_columns(members, _DB_CLUSTER_MEMBER_COLS, table_format)
     
     def _format_db_snapshots_table(self, snapshots: List[Dict[str, Any]], 
                                  table_format: str) -> str:
         """Format DB snapshots into a table."""
-        table_data = []
-        for snapshot in snapshots:
-            row = {
-                'Snapshot ID': snapshot.get('resource_id', 'N/A'),
-                'DB Instance ID': snapshot.get('db_instance_id', 'N/A'),
-                'Type': snapshot.get('snapshot_type', 'N/A'),
-                'Status': snapshot.get('status', 'N/A'),
-                'Storage (GB)': snapshot.get('allocated_storage', 'N/A'),
-                'Storage Type': snapshot.get('storage_type', 'N/A'),
-                'Encrypted': snapshot.get('encrypted', 'N/A'),
-                'Engine': snapshot.get('engine', 'N/A'),
-                'Creation Time': snapshot.get('creation_time', 'N/A')[:19] if snapshot.get('creation_time') else 'N/A',
-                'AZ': snapshot.get('availability_zone', 'N/A'),
-                'Tags': self._format_tags(snapshot.get('tags', {}))
-            }
-            table_data.append(row)
-        
-        df = pd.DataFrame(table_data)
-        return tabulate(df, headers='keys', tablefmt=table_format, showindex=False)
+        return self._tabulate_columns(snapshots, _DB_SNAPSHOT_COLS, table_format)
     
     def _format_db_cluster_snapshots_table(self, snapshots: List[Dict[str, Any]], 
                                          table_format: str) -> str:
         """Format DB cluster snapshots into a table."""
-        table_data = []
-        for snapshot in snapshots:
-            row = {
-                'Snapshot ID': snapshot.get('resource_id', 'N/A'),
-                'DB Cluster ID': snapshot.get('db_cluster_id', 'N/A'),
-                'Type': snapshot.get('snapshot_type', 'N/A'),
-                'Status': snapshot.get('status', 'N/A'),
-                'Storage (GB)': snapshot.get('allocated_storage', 'N/A'),
-                'Encrypted': snapshot.get('storage_encrypted', 'N/A'),
-                'Engine': snapshot.get('engine', 'N/A'),
-                'Creation Time': snapshot.get('creation_time', 'N/A')[:19] if snapshot.get('creation_time') else 'N/A',
-                'Availability Zones': ', '.join(snapshot.get('availability_zones', [])),
-                'Tags': self._format_tags(snapshot.get('tags', {}))
-            }
-            table_data.append(row)
-        
-        df = pd.DataFrame(table_data)
-        return tabulate(df, headers='keys', tablefmt=table_format, showindex=False)
+        return self._tabulate_columns(snapshots, _DB_CLUSTER_SNAPSHOT_COLS, table_format)
     
     def _format_vpc_security_groups_table(self, security_groups: List[Dict[str, Any]], 
                                         table_format: str) -> str:
         """Format VPC security groups into a table."""
-        table_data = []
-        for sg in security_groups:
-            row = {
-                'Security Group ID': sg.get('resource_id', 'N/A'),
-                'Name': sg.get('name', 'N/A'),
-                'Description': sg.get('description', 'N/A')[:40] + '...' if len(sg.get('description', '')) > 40 else sg.get('description', 'N/A'),
-                'VPC ID': sg.get('vpc_id', 'N/A'),
-                'Inbound Rules': sg.get('inbound_rules', 'N/A'),
-                'Outbound Rules': sg.get('outbound_rules', 'N/A'),
-                'Tags': self._format_tags(sg.get('tags', {}))
-            }
-            table_data.append(row)
-        
-        df = pd.DataFrame(table_data)
-        return tabulate(df, headers='keys', tablefmt=table_format, showindex=False)
+        return self._tabulate_columns(security_groups, _VPC_SECURITY_GROUP_COLS, table_format)
     
     def _format_db_security_groups_table(self, security_groups: List[Dict[str, Any]], 
                                        table_format: str) -> str:
         """Format DB security groups into a table."""
-        table_data = []
-        for sg in security_groups:
-            row = {
-                'DB Security Group': sg.get('resource_id', 'N/A'),
-                'Name': sg.get('name', 'N/A'),
-                'Description': sg.get('description', 'N/A'),
-                'Status': sg.get('status', 'N/A'),
-                'VPC': sg.get('vpc_id', 'N/A')
-            }
-            table_data.append(row)
-        
-        df = pd.DataFrame(table_data)
-        return tabulate(df, headers='keys', tablefmt=table_format, showindex=False)
+        return self._tabulate_columns(security_groups, _DB_SECURITY_GROUP_COLS, table_format,
+                                      with_tags=False)
     
     def _format_db_subnet_groups_table(self, subnet_groups: List[Dict[str, Any]], 
                                      table_format: str) -> str:
         """Format DB subnet groups into a table."""
-        table_data = []
-        for sg in subnet_groups:
-            row = {
-                'Subnet Group Name': sg.get('resource_id', 'N/A'),
-                'Description': sg.get('description', 'N/A')[:40] + '...' if len(sg.get('description', '')) > 40 else sg.get('description', 'N/A'),
-                'VPC ID': sg.get('vpc_id', 'N/A'),
-                'Status': sg.get('status', 'N/A'),
-                'Subnets': ', '.join(sg.get('subnets', [])[:3]) + ('...' if len(sg.get('subnets', [])) > 3 else ''),
-                'Availability Zones': ', '.join(sg.get('availability_zones', [])),
-                'Tags': self._format_tags(sg.get('tags', {}))
-            }
-            table_data.append(row)
-        
-        df = pd.DataFrame(table_data)
-        return tabulate(df, headers='keys', tablefmt=table_format, showindex=False)
+        return self._tabulate_columns(subnet_groups, _DB_SUBNET_GROUP_COLS, table_format)
     
     def _format_db_parameter_groups_table(self, parameter_groups: List[Dict[str, Any]], 
                                         table_format: str) -> str:
         """Format DB parameter groups into a table."""
-        table_data = []
-        for pg in parameter_groups:
-            row = {
-                'Parameter Group Name': pg.get('resource_id', 'N/A'),
-                'Family': pg.get('family', 'N/A'),
-                'Description': pg.get('description', 'N/A')[:40] + '...' if len(pg.get('description', '')) > 40 else pg.get('description', 'N/A'),
-                'Tags': self._format_tags(pg.get('tags', {}))
-            }
-            table_data.append(row)
-        
-        df = pd.DataFrame(table_data)
-        return tabulate(df, headers='keys', tablefmt=table_format, showindex=False)
+        return self._tabulate_columns(parameter_groups, _DB_PARAMETER_GROUP_COLS, table_format)
     
     def _format_db_cluster_parameter_groups_table(self, parameter_groups: List[Dict[str, Any]], 
                                                 table_format: str) -> str:
         """Format DB cluster parameter groups into a table."""
-        table_data = []
-        for pg in parameter_groups:
-            row = {
-                'Cluster Parameter Group': pg.get('resource_id', 'N/A'),
-                'Family': pg.get('family', 'N/A'),
-                'Description': pg.get('description', 'N/A')[:40] + '...' if len(pg.get('description', '')) > 40 else pg.get('description', 'N/A'),
-                'Tags': self._format_tags(pg.get('tags', {}))
-            }
-            table_data.append(row)
-        
-        df = pd.DataFrame(table_data)
-        return tabulate(df, headers='keys', tablefmt=table_format, showindex=False)
+        return self._tabulate_columns(parameter_groups, _DB_CLUSTER_PARAMETER_GROUP_COLS, table_format)
     
     def _format_option_groups_table(self, option_groups: List[Dict[str, Any]], 
                                   table_format: str) -> str:
         """Format option groups into a table."""
-        table_data = []
-        for og in option_groups:
-            row = {
-                'Option Group Name': og.get('resource_id', 'N/A'),
-                'Description': og.get('description', 'N/A')[:40] + '...' if len(og.get('description', '')) > 40 else og.get('description', 'N/A'),
-                'Engine': og.get('engine_name', 'N/A'),
-                'Engine Version': og.get('major_engine_version', 'N/A'),
-                'VPC ID': og.get('vpc_id', 'N/A'),
-                'Options': ', '.join(og.get('options', [])),
-                'Tags': self._format_tags(og.get('tags', {}))
-            }
-            table_data.append(row)
+        return self._tabulate_columns(option_groups, _OPTION_GROUP_COLS, table_format)
+    
+    def _tabulate_columns(self, resources: List[Dict[str, Any]], columns: ColumnSpec,
+                          table_format: str, with_tags: bool = True) -> str:
+        """
+        Render resources as a table described by a column spec.
         
-        df = pd.DataFrame(table_data)
-        return tabulate(df, headers='keys', tablefmt=table_format, showindex=False)
+        Args:
+            resources: List of resource dictionaries of one type
+            columns: (header, getter) pairs; each getter maps a resource to its cell
+            table_format: Table format for tabulate
+            with_tags: Append a formatted Tags column
+            
+        Returns:
+            Formatted table as string
+        """
+        headers = [header for header, _ in columns]
+        getters = [getter for _, getter in columns]
+        
+        if with_tags:
+            format_tags = self._format_tags
+            headers.append('Tags')
+            getters.append(lambda resource: format_tags(resource.get('tags', {})))
+        
+        # Every cell, tags included, is extracted in one pass over the resources
+        rows = [[getter(resource) for getter in getters] for resource in resources]
+        
+        from tabulate import tabulate
+        
+        return tabulate(rows, headers=headers, tablefmt=table_format)
     
     def _format_generic_table(self, resources: List[Dict[str, Any]], 
                             table_format: str) -> str:
@@ -342,32 +398,39 @@ class RDSResourceTableFormatter:
             }
             table_data.append(row)
         
-        df = pd.DataFrame(table_data)
-        return tabulate(df, headers='keys', tablefmt=table_format, showindex=False)
+        from tabulate import tabulate
+        
+        return tabulate(table_data, headers='keys', tablefmt=table_format)
     
     def _format_resource_details(self, resource: Dict[str, Any]) -> str:
         """Format resource details into a compact string."""
-        details = []
+        # Empty lists and dicts are skipped too, so they never use up a slot
+        shown = (
+            (key, value) for key, value in resource.items()
+            if key not in _DETAIL_SKIP and value is not None and value != 'N/A'
+            and (value or not isinstance(value, (list, dict)))
+        )
         
-        # Skip common fields that are already displayed
-        skip_fields = {'resource_type', 'resource_id', 'tags'}
-        
-        for key, value in resource.items():
-            if key not in skip_fields and value is not None and value != 'N/A':
-                if isinstance(value, (list, dict)):
-                    if value:  # Only add if not empty
-                        details.append(f"{key}: {str(value)[:50]}...")
-                else:
-                    details.append(f"{key}: {value}")
+        details = []
+        for key, value in islice(shown, 3):  # Limit to first 3 details to keep it readable
+            if isinstance(value, (list, dict)):
+                details.append(f"{key}: {str(value)[:50]}...")
+            else:
+                details.append(f"{key}: {value}")
         
-        return '; '.join(details[:3])  # Limit to first 3 details to keep it readable
+        return '; '.join(details)
     
-    def _format_tags(self, tags: Dict[str, str]) -> str:
-        """Format tags dictionary into a readable string."""
+    def _format_tags(self, tags: Union[Dict[str, str], Sequence[Tuple[str, str]]]) -> str:
+        """
+        Format tags into a readable string.
+        
+        Accepts a tags dictionary or a sequence of (key, value) pairs.
+        """
         if not tags:
             return 'None'
         
-        tag_strings = [f"{k}:{v}" for k, v in list(tags.items())[:2]]  # Show first 2 tags
+        pairs = tags.items() if isinstance(tags, dict) else tags
+        tag_strings = [f"{k}:{v}" for k, v in islice(pairs, 2)]  # Show first 2 tags
         result = ', '.join(tag_strings)
         
         if len(tags) > 2:
@@ -376,35 +439,33 @@ class RDSResourceTableFormatter:
         return result
     
     def format_summary_table(self, summary: Dict[str, Any], 
-                           table_format: str = "grid") -> str:
+                           table_format: str = "grid", fast: bool = False) -> str:
         """
         Format the resource summary into a table.
         
         Args:
             summary: Summary dictionary from resource discovery
             table_format: Table format for tabulate
+            fast: Render borderless plain tables, the cheapest tabulate format (overrides table_format)
             
         Returns:
             Formatted summary table as string
         """
-        table_data = []
+        if fast:
+            table_format = _FAST_TABLE_FORMAT
         
-        for resource_type, count in summary.items():
-            if resource_type != 'total_resources':
-                row = {
-                    'Resource Type': resource_type.replace('_', ' ').title(),
-                    'Count': count
-                }
-                table_data.append(row)
+        rows = [
+            (resource_type.replace('_', ' ').title(), count)
+            for resource_type, count in summary.items()
+            if resource_type != 'total_resources'
+        ]
         
         # Add total row
-        table_data.append({
-            'Resource Type': 'TOTAL',
-            'Count': summary.get('total_resources', 0)
-        })
+        rows.append(('TOTAL', summary.get('total_resources', 0)))
         
-        df = pd.DataFrame(table_data)
-        return tabulate(df, headers='keys', tablefmt=table_format, showindex=False)
+        from tabulate import tabulate
+        
+        return tabulate(rows, headers=_SUMMARY_HEADERS, tablefmt=table_format)
     
     def export_to_csv(self, resources: List[Dict[str, Any]], 
                      filename: str) -> str:
@@ -418,28 +479,31 @@ class RDSResourceTableFormatter:
         Returns:
             Success message with filename
         """
-        # Flatten the resources for CSV export
-        flattened_resources = []
+        # Two passes over the flattened rows instead of holding them all: the
+        # first collects headers in first-seen order, the second streams rows
+        headers = dict.fromkeys(key for row in self._flatten(resources) for key in row)
+        
+        with open(filename, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(headers), restval='', lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(self._flatten(resources))
         
+        return f"Resources exported to {filename}"
+    
+    def _flatten(self, resources: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield each resource as a CSV row: dicts become prefixed columns, lists joined strings."""
         for resource in resources:
             flattened = {}
             for key, value in resource.items():
                 if isinstance(value, dict):
                     # Flatten dictionaries (like tags)
-                    for sub_key, sub_value in value.items():
-                        flattened[f"{key}_{sub_key}"] = sub_value
+                    flattened.update((f"{key}_{sub_key}", sub_value) for sub_key, sub_value in value.items())
                 elif isinstance(value, list):
                     # Convert lists to comma-separated strings
                     flattened[key] = ', '.join(map(str, value))
                 else:
                     flattened[key] = value
-            
-            flattened_resources.append(flattened)
-        
-        df = pd.DataFrame(flattened_resources)
-        df.to_csv(filename, index=False)
-        
-        return f"Resources exported to {filename}"
+            yield flattened
     
     def export_to_json(self, discovery_result: Dict[str, Any], 
                       filename: str) -> str:
@@ -453,8 +517,9 @@ class RDSResourceTableFormatter:
         Returns:
             Success message with filename
         """
-        with open(filename, 'w') as f:
-            json.dump(discovery_result, f, indent=2, default=str)
+        # Same encoder as RDSResourceDiscovery.to_json; the document goes out in one write
+        with open(filename, 'wb') as f:
+            f.write(rds_json.dumps(discovery_result, indent=True))
         
         return f"Discovery result exported to {filename}"
 
@@ -6,8 +6,19 @@ This script tests the table formatting functionality using mock data,
 allowing validation without requiring AWS credentials.
 """
 
+import argparse
+import collections
+import contextlib
+import functools
+import io
+import json
+import logging
 import sys
 import os
+import subprocess
+import threading
+import time
+import types
 from datetime import datetime
 
 # Add current directory to path to import our modules
@@ -15,9 +26,21 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from rds_table_formatter import RDSResourceTableFormatter
 
+try:
+    import orjson  # Optional: faster parsing of the exported JSON when installed
+except ImportError:
+    orjson = None
 
+# Rules used to frame the test output
+_BANNER = "=" * 80
+_SECTION = "=" * 60
+_RULE = "-" * 40
+_SUBRULE = "-" * 30
+
+
+@functools.lru_cache(maxsize=None)
 def create_mock_db_instance_data():
-    """Create mock data for a DB instance discovery result."""
+    """Create mock data for a DB instance discovery result (built once and shared; treat as read-only)."""
     return {
         'resource_type': 'db_instance',
         'resource_details': {
@@ -166,8 +189,9 @@ def create_mock_db_instance_data():
     }
 
 
+@functools.lru_cache(maxsize=None)
 def create_mock_db_cluster_data():
-    """Create mock data for a DB cluster discovery result."""
+    """Create mock data for a DB cluster discovery result (built once and shared; treat as read-only)."""
     return {
         'resource_type': 'db_cluster',
         'resource_details': {
@@ -308,176 +332,639 @@ def create_mock_db_cluster_data():
     }
 
 
-def test_table_formatting():
-    """Test the table formatting functionality."""
-    print("="*80)
-    print("Testing AWS RDS Resource Discovery Table Formatting")
-    print("="*80)
+def _load_json(path):
+    """Parse an exported JSON file, with orjson when it is installed."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+@contextlib.contextmanager
+def _batched_output():
+    """Collect a test's report lines and write them to stdout in one call, even on failure."""
+    lines = []
+    try:
+        yield lines
+    finally:
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+
+def test_table_formatting(quick: bool = False):
+    """Test the table formatting functionality (quick skips the extra table renders)."""
+    with _batched_output() as out:
+        out.append(_BANNER)
+        out.append("Testing AWS RDS Resource Discovery Table Formatting")
+        out.append(_BANNER)
+        
+        formatter = RDSResourceTableFormatter()
+        
+        # Test DB Instance formatting
+        out.append("\n" + _SECTION)
+        out.append("TEST 1: DB Instance Resource Discovery")
+        out.append(_SECTION)
+        
+        db_instance_data = create_mock_db_instance_data()
+        
+        out.append("\n1.1 Summary Table:")
+        out.append(_RULE)
+        summary_table = formatter.format_summary_table(db_instance_data['summary'])
+        out.append(summary_table)
+        
+        out.append("\n1.2 Simple Resources Table:")
+        out.append(_RULE)
+        simple_table = formatter.format_resources_table(db_instance_data['resources'])
+        out.append(simple_table)
+        
+        out.append("\n1.3 Detailed Resources Table (Fancy Grid):")
+        out.append(_RULE)
+        detailed_table = formatter.format_detailed_resources_table(
+            db_instance_data['resources'], 'fancy_grid'
+        )
+        out.append(detailed_table)
+        
+        # Test DB Cluster formatting
+        out.append("\n" + _SECTION)
+        out.append("TEST 2: DB Cluster Resource Discovery")
+        out.append(_SECTION)
+        
+        db_cluster_data = create_mock_db_cluster_data()
+        
+        out.append("\n2.1 Summary Table:")
+        out.append(_RULE)
+        cluster_summary_table = formatter.format_summary_table(db_cluster_data['summary'])
+        out.append(cluster_summary_table)
+        
+        if not quick:
+            out.append("\n2.2 Detailed Resources Table (Grid):")
+            out.append(_RULE)
+            cluster_detailed_table = formatter.format_detailed_resources_table(
+                db_cluster_data['resources'], 'grid'
+            )
+            out.append(cluster_detailed_table)
+        
+        # Test export functionality
+        out.append("\n" + _SECTION)
+        out.append("TEST 3: Export Functionality")
+        out.append(_SECTION)
+        
+        try:
+            # Test CSV export
+            csv_message = formatter.export_to_csv(
+                db_instance_data['resources'], 
+                'test_rds_resources.csv'
+            )
+            out.append(f"✓ {csv_message}")
+        
+            # Test JSON export
+            json_message = formatter.export_to_json(
+                db_instance_data, 
+                'test_rds_discovery_result.json'
+            )
+            out.append(f"✓ {json_message}")
+        
+            # Test cluster CSV export
+            cluster_csv_message = formatter.export_to_csv(
+                db_cluster_data['resources'], 
+                'test_rds_cluster_resources.csv'
+            )
+            out.append(f"✓ {cluster_csv_message}")
+        
+            # Test cluster JSON export
+            cluster_json_message = formatter.export_to_json(
+                db_cluster_data, 
+                'test_rds_cluster_discovery_result.json'
+            )
+            out.append(f"✓ {cluster_json_message}")
+        
+        except Exception as e:
+            out.append(f"✗ Export test failed: {str(e)}")
+        
+        # Verify the JSON exports round-trip to the original results
+        assert _load_json('test_rds_discovery_result.json') == db_instance_data
+        assert _load_json('test_rds_cluster_discovery_result.json') == db_cluster_data
+        out.append("✓ JSON exports round-trip")
+        
+        # Test different table formats
+        out.append("\n" + _SECTION)
+        out.append("TEST 4: Different Table Formats")
+        out.append(_SECTION)
+        
+        if quick:
+            out.append("Skipped (--quick)")
+        else:
+            test_resources = db_instance_data['resources'][:3]  # Use first 3 resources for brevity
+            
+            formats = ['simple', 'pipe', 'orgtbl', 'rst']
+            for index, fmt in enumerate(formats, 1):
+                out.append(f"\n4.{index} Format: {fmt}")
+                out.append(_SUBRULE)
+                try:
+                    table = formatter.format_resources_table(test_resources, fmt)
+                    out.append(table)
+                except Exception as e:
+                    out.append(f"✗ Error with format {fmt}: {str(e)}")
+        
+        out.append("\n" + _BANNER)
+        out.append("✓ All table formatting tests completed successfully!")
+        out.append(_BANNER)
+
+
+def test_individual_components():
+    """Test individual components of the formatter."""
+    with _batched_output() as out:
+        out.append("\n" + _SECTION)
+        out.append("TEST 5: Individual Component Testing")
+        out.append(_SECTION)
+        
+        formatter = RDSResourceTableFormatter()
+        
+        # Test tag formatting
+        out.append("\n5.1 Tag Formatting:")
+        out.append(_SUBRULE)
+        test_tags = {
+            'Name': 'TestResource',
+            'Environment': 'Production',
+            'Owner': 'DataTeam',
+            'Project': 'WebApp',
+            'CostCenter': '12345'
+        }
+        formatted_tags = formatter._format_tags(test_tags)
+        out.append(f"Input tags: {test_tags}")
+        out.append(f"Formatted: {formatted_tags}")
+        
+        # Test tags given as (key, value) pairs
+        pair_tags = formatter._format_tags(tuple(test_tags.items()))
+        assert pair_tags == formatted_tags, "Tag pairs should format like the dict"
+        out.append(f"Formatted pairs: {pair_tags}")
+        
+        # Formatting reflects the tags as they are now, not an earlier render
+        mutable_tags = {'Env': 'dev'}
+        formatter._format_tags(mutable_tags)
+        mutable_tags.update(Env='prod', Owner='x')
+        assert formatter._format_tags(mutable_tags) == 'Env:prod, Owner:x', "Stale tag text returned"
+        
+        # Test empty tags
+        empty_tags = formatter._format_tags({})
+        out.append(f"Empty tags: {empty_tags}")
+        
+        # Test resource details formatting
+        out.append("\n5.2 Resource Details Formatting:")
+        out.append(_SUBRULE)
+        test_resource = {
+            'resource_type': 'DB Instance',
+            'resource_id': 'test-instance',
+            'engine': 'mysql',
+            'status': 'available',
+            'allocated_storage': 20,
+            'tags': {'Name': 'Test'}
+        }
+        formatted_details = formatter._format_resource_details(test_resource)
+        out.append(f"Input resource: {test_resource}")
+        out.append(f"Formatted details: {formatted_details}")
+        
+        # Test streamed detailed table matches the buffered one
+        out.append("\n5.3 Streamed Detailed Table:")
+        out.append(_SUBRULE)
+        cluster_resources = create_mock_db_cluster_data()['resources']
+        stream = io.StringIO()
+        formatter.format_detailed_resources_stream(cluster_resources, 'grid', stream)
+        assert stream.getvalue() == formatter.format_detailed_resources_table(cluster_resources, 'grid')
+        out.append("Streamed output matches buffered output")
+        
+        # The default stream is whatever sys.stdout is at call time
+        redirected = io.StringIO()
+        with contextlib.redirect_stdout(redirected):
+            formatter.format_detailed_resources_stream(cluster_resources, 'grid')
+        assert redirected.getvalue() == stream.getvalue(), "Default stream ignored redirect_stdout"
+        out.append("Default stream follows redirected stdout")
+        
+        # Test fast mode renders plain tables
+        out.append("\n5.4 Fast Plain Tables:")
+        out.append(_SUBRULE)
+        fast_table = formatter.format_detailed_resources_table(cluster_resources, 'grid', fast=True)
+        assert fast_table == formatter.format_detailed_resources_table(cluster_resources, 'plain')
+        out.append("Fast mode matches the plain table format")
+        
+        out.append("\n✓ Individual component tests completed!")
+
+
+def test_lazy_imports():
+    """Test that importing the CLI module does not load heavy dependencies."""
+    print("\n" + _SECTION)
+    print("TEST 6: CLI Import Cost")
+    print(_SECTION)
     
-    formatter = RDSResourceTableFormatter()
+    check = (
+        "import sys, aws_rds_resource_discovery; "
+        "heavy = [m for m in ('boto3', 'botocore', 'pandas', 'tabulate') if m in sys.modules]; "
+        "print(','.join(heavy))"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', check],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True, check=True
+    )
+    loaded = result.stdout.strip()
+    print(f"Heavy modules loaded on import: {loaded or 'None'}")
+    assert not loaded, f"CLI import eagerly loaded: {loaded}"
     
-    # Test DB Instance formatting
-    print("\n" + "="*60)
-    print("TEST 1: DB Instance Resource Discovery")
-    print("="*60)
+    # The pre-rendered --help must match what argparse would print
+    import aws_rds_resource_discovery as cli
+    parser = cli._build_parser.__wrapped__()
+    parser.prog = cli._HELP_PROG
+    saved_columns = os.environ.get('COLUMNS')
+    os.environ['COLUMNS'] = '80'
+    try:
+        rendered = parser.format_help().replace('optional arguments:', 'options:')
+    finally:
+        if saved_columns is None:
+            del os.environ['COLUMNS']
+        else:
+            os.environ['COLUMNS'] = saved_columns
+    assert cli._STATIC_HELP == rendered, "Static --help text is out of date"
+    print("Static --help text matches argparse output")
     
-    db_instance_data = create_mock_db_instance_data()
+    print("\n✓ CLI import cost tests completed!")
+
+
+def test_client_cache():
+    """Test that discovery instances share boto3 clients per region/profile."""
+    print("\n" + _SECTION)
+    print("TEST 7: boto3 Client Reuse")
+    print(_SECTION)
     
-    print("\n1.1 Summary Table:")
-    print("-" * 40)
-    summary_table = formatter.format_summary_table(db_instance_data['summary'])
-    print(summary_table)
+    from rds_resource_discovery import RDSResourceDiscovery
     
-    print("\n1.2 Simple Resources Table:")
-    print("-" * 40)
-    simple_table = formatter.format_resources_table(db_instance_data['resources'])
-    print(simple_table)
+    # The opt-out may already be set by the caller; clear it for the shared-client checks
+    saved_no_cache = os.environ.pop('RDS_DISCOVERY_NO_CACHE', None)
+    try:
+        first = RDSResourceDiscovery(region_name='us-east-1')
+        second = RDSResourceDiscovery(region_name='us-east-1')
+        other_region = RDSResourceDiscovery(region_name='eu-west-1')
+        assert first.rds_client is second.rds_client, "RDS client not shared for the same region"
+        assert first.ec2_client is second.ec2_client, "EC2 client not shared for the same region"
+        assert first.rds_client is not other_region.rds_client, "RDS client shared across regions"
+        print("Clients reused for matching region/profile")
+        
+        os.environ['RDS_DISCOVERY_NO_CACHE'] = '1'
+        uncached = RDSResourceDiscovery(region_name='us-east-1')
+    finally:
+        if saved_no_cache is None:
+            os.environ.pop('RDS_DISCOVERY_NO_CACHE', None)
+        else:
+            os.environ['RDS_DISCOVERY_NO_CACHE'] = saved_no_cache
+    assert uncached.rds_client is not first.rds_client, "RDS_DISCOVERY_NO_CACHE=1 reused a cached client"
+    print("RDS_DISCOVERY_NO_CACHE=1 builds fresh clients")
     
-    print("\n1.3 Detailed Resources Table (Fancy Grid):")
-    print("-" * 40)
-    detailed_table = formatter.format_detailed_resources_table(
-        db_instance_data['resources'], 'fancy_grid'
-    )
-    print(detailed_table)
+    print("\n✓ Client reuse tests completed!")
+
+
+def test_response_cache():
+    """Test the on-disk TTL cache for describe responses."""
+    print("\n" + _SECTION)
+    print("TEST 8: Describe Response Cache")
+    print(_SECTION)
     
-    # Test DB Cluster formatting
-    print("\n" + "="*60)
-    print("TEST 2: DB Cluster Resource Discovery")
-    print("="*60)
+    import tempfile
+    from rds_resource_discovery import _CachingClient
     
-    db_cluster_data = create_mock_db_cluster_data()
+    class FakeRDSClient:
+        def __init__(self):
+            self.calls = 0
+        
+        def describe_db_instances(self, **kwargs):
+            self.calls += 1
+            return {'DBInstances': [{'DBInstanceIdentifier': kwargs['DBInstanceIdentifier'],
+                                     'InstanceCreateTime': datetime(2024, 6, 20, 10, 30)}]}
     
-    print("\n2.1 Summary Table:")
-    print("-" * 40)
-    cluster_summary_table = formatter.format_summary_table(db_cluster_data['summary'])
-    print(cluster_summary_table)
+    fake = FakeRDSClient()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        client = _CachingClient(fake, ('rds', 'us-east-1', None), cache_dir, ttl=60)
+        first = client.describe_db_instances(DBInstanceIdentifier='db-1')
+        second = client.describe_db_instances(DBInstanceIdentifier='db-1')
+        client.describe_db_instances(DBInstanceIdentifier='db-2')
+        assert fake.calls == 2
+        assert second == first
+        assert isinstance(second['DBInstances'][0]['InstanceCreateTime'], datetime)
+        print("Repeated call served from cache with datetimes preserved")
+        
+        expired = _CachingClient(fake, ('rds', 'us-east-1', None), cache_dir, ttl=-1)
+        expired.describe_db_instances(DBInstanceIdentifier='db-1')
+        assert fake.calls == 3
+        print("Expired entries trigger a fresh API call")
     
-    print("\n2.2 Detailed Resources Table (Grid):")
-    print("-" * 40)
-    cluster_detailed_table = formatter.format_detailed_resources_table(
-        db_cluster_data['resources'], 'grid'
-    )
-    print(cluster_detailed_table)
+    print("\n✓ Response cache tests completed!")
+
+
+def test_to_json():
+    """Test that to_json and export_to_json render datetimes the same with and without orjson."""
+    print("\n" + _SECTION)
+    print("TEST 9: Discovery Result Serialization")
+    print(_SECTION)
     
-    # Test export functionality
-    print("\n" + "="*60)
-    print("TEST 3: Export Functionality")
-    print("="*60)
+    import tempfile
+    import rds_json
+    from rds_resource_discovery import RDSResourceDiscovery
     
+    result = {
+        'resource_type': 'db_instance',
+        'resources': [{'resource_id': 'snap-1', 'creation_time': datetime(2024, 6, 20, 10, 30, 15)}]
+    }
+    expected = {
+        'resource_type': 'db_instance',
+        'resources': [{'resource_id': 'snap-1', 'creation_time': '2024-06-20T10:30:15'}]
+    }
+    
+    def serialize():
+        """Return the to_json and export_to_json documents, parsed."""
+        with tempfile.TemporaryDirectory() as export_dir:
+            path = os.path.join(export_dir, 'result.json')
+            RDSResourceTableFormatter().export_to_json(result, path)
+            return json.loads(RDSResourceDiscovery.to_json(result)), _load_json(path)
+    
+    saved_orjson = rds_json.orjson
     try:
-        # Test CSV export
-        csv_message = formatter.export_to_csv(
-            db_instance_data['resources'], 
-            'test_rds_resources.csv'
-        )
-        print(f"✓ {csv_message}")
-        
-        # Test JSON export
-        json_message = formatter.export_to_json(
-            db_instance_data, 
-            'test_rds_discovery_result.json'
-        )
-        print(f"✓ {json_message}")
-        
-        # Test cluster CSV export
-        cluster_csv_message = formatter.export_to_csv(
-            db_cluster_data['resources'], 
-            'test_rds_cluster_resources.csv'
-        )
-        print(f"✓ {cluster_csv_message}")
-        
-        # Test cluster JSON export
-        cluster_json_message = formatter.export_to_json(
-            db_cluster_data, 
-            'test_rds_cluster_discovery_result.json'
-        )
-        print(f"✓ {cluster_json_message}")
-        
-    except Exception as e:
-        print(f"✗ Export test failed: {str(e)}")
+        rds_json.orjson = None
+        fallback = serialize()
+    finally:
+        rds_json.orjson = saved_orjson
+    assert fallback == (expected, expected), f"json fallback rendered {fallback}"
+    print("json fallback writes datetimes as ISO 8601")
     
-    # Test different table formats
-    print("\n" + "="*60)
-    print("TEST 4: Different Table Formats")
-    print("="*60)
+    if saved_orjson is None:
+        print("orjson not installed; skipping orjson comparison")
+    else:
+        fast = serialize()
+        assert fast == fallback, f"orjson rendered {fast}, json fallback rendered {fallback}"
+        print("orjson and json fallback produce the same document")
     
-    test_resources = db_instance_data['resources'][:3]  # Use first 3 resources for brevity
+    print("\n✓ Serialization tests completed!")
+
+
+class FakeAWSClient:
+    """Minimal boto3 client stand-in that records every call and paginated page served."""
     
-    formats = ['simple', 'pipe', 'orgtbl', 'rst']
-    for fmt in formats:
-        print(f"\n4.{formats.index(fmt)+1} Format: {fmt}")
-        print("-" * 30)
-        try:
-            table = formatter.format_resources_table(test_resources, fmt)
-            print(table)
-        except Exception as e:
-            print(f"✗ Error with format {fmt}: {str(e)}")
+    def __init__(self, responses, pages=None):
+        """
+        Args:
+            responses: Operation name to response dict, or to a function of the call kwargs
+            pages: Paginated operation name to its list of pages
+        """
+        self.responses = responses
+        self.pages = pages or {}
+        self.calls = []
+        self.pages_served = collections.Counter()
+        self.meta = types.SimpleNamespace(method_to_api_mapping=dict.fromkeys(responses))
+        self._lock = threading.Lock()
+    
+    def __getattr__(self, name):
+        if name not in self.responses:
+            raise AttributeError(name)
+        
+        def call(**kwargs):
+            with self._lock:
+                self.calls.append((name, kwargs))
+            response = self.responses[name]
+            return response(kwargs) if callable(response) else response
+        return call
+    
+    def get_paginator(self, operation_name):
+        client = self
+        
+        class Paginator:
+            def paginate(self, **kwargs):
+                with client._lock:
+                    client.calls.append((f'paginate:{operation_name}', kwargs))
+                return self._pages()
+            
+            def _pages(self):
+                for page in client.pages[operation_name]:
+                    with client._lock:
+                        client.pages_served[operation_name] += 1
+                    yield page
+        return Paginator()
     
-    print("\n" + "="*80)
-    print("✓ All table formatting tests completed successfully!")
-    print("="*80)
+    def count(self, operation_name):
+        """Number of recorded calls to an operation."""
+        return sum(1 for name, _ in self.calls if name == operation_name)
 
 
-def test_individual_components():
-    """Test individual components of the formatter."""
-    print("\n" + "="*60)
-    print("TEST 5: Individual Component Testing")
-    print("="*60)
+def _fake_db_instance(db_instance_id, **extra):
+    """Raw DescribeDBInstances entry with its TagList embedded."""
+    db_instance = {
+        'DBInstanceIdentifier': db_instance_id,
+        'DBInstanceArn': f'arn:aws:rds:us-east-1:123456789012:db:{db_instance_id}',
+        'DBInstanceClass': 'db.t3.micro',
+        'Engine': 'mysql',
+        'EngineVersion': '8.0.35',
+        'DBInstanceStatus': 'available',
+        'AvailabilityZone': 'us-east-1a',
+        'TagList': [{'Key': 'Name', 'Value': db_instance_id}]
+    }
+    db_instance.update(extra)
+    return db_instance
+
+
+def _fake_snapshot(snapshot_id, tagged):
+    """Raw DescribeDBSnapshots entry, with or without an embedded TagList."""
+    snapshot = {
+        'DBSnapshotIdentifier': snapshot_id,
+        'DBSnapshotArn': f'arn:aws:rds:us-east-1:123456789012:snapshot:{snapshot_id}',
+        'DBInstanceIdentifier': 'db-1',
+        'SnapshotType': 'manual',
+        'Status': 'available',
+        'SnapshotCreateTime': datetime(2024, 6, 20, 10, 30)
+    }
+    if tagged:
+        snapshot['TagList'] = [{'Key': 'Backup', 'Value': snapshot_id}]
+    return snapshot
+
+
+def _fake_shared_responses():
+    """Describe responses for the groups both discoveries reference."""
+    return {
+        'describe_db_subnet_groups': {'DBSubnetGroups': [{
+            'DBSubnetGroupName': 'subnets-1', 'DBSubnetGroupDescription': 'DB subnets',
+            'VpcId': 'vpc-1', 'SubnetGroupStatus': 'Complete',
+            'Subnets': [{'SubnetIdentifier': 'subnet-a', 'SubnetAvailabilityZone': {'Name': 'us-east-1a'}}],
+            'TagList': []
+        }]},
+        'list_tags_for_resource': lambda kwargs: {
+            'TagList': [{'Key': 'Fetched', 'Value': kwargs['ResourceName'].rsplit(':', 1)[-1]}]
+        }
+    }
+
+
+def test_discovery_api_calls():
+    """Test the AWS calls made by each discovery against recording fake clients."""
+    print("\n" + _SECTION)
+    print("TEST 10: Discovery API Calls")
+    print(_SECTION)
+    
+    from rds_resource_discovery import RDSResourceDiscovery, _BoundedClient
+    
+    ec2 = FakeAWSClient({'describe_security_groups': {'SecurityGroups': [{
+        'GroupId': 'sg-1', 'GroupName': 'db', 'Description': 'DB access', 'VpcId': 'vpc-1',
+        'Tags': [{'Key': 'Name', 'Value': 'db'}]
+    }]}})
     
-    formatter = RDSResourceTableFormatter()
+    def discover(rds, discover_name, identifier):
+        """Run one discovery on bounded fake clients; return the result and engine errors."""
+        # More slots than the run makes calls, so a leaked slot fails the check below
+        # rather than deadlocking the discovery
+        slots = 32
+        semaphore = threading.BoundedSemaphore(slots)
+        discovery = RDSResourceDiscovery(region_name='us-east-1')
+        discovery._connection = (_BoundedClient(rds, semaphore), _BoundedClient(ec2, semaphore), 'us-east-1')
+        
+        errors = []
+        handler = logging.Handler(logging.ERROR)
+        handler.emit = lambda record: errors.append(record.getMessage())
+        engine_logger = logging.getLogger('rds_discovery.engine')
+        engine_logger.addHandler(handler)
+        try:
+            result = getattr(discovery, discover_name)(identifier)
+        finally:
+            engine_logger.removeHandler(handler)
+        
+        # Every bounded call and page request must have released its slot
+        assert all(semaphore.acquire(blocking=False) for _ in range(slots)), "Semaphore slot leaked"
+        return result, errors
+    
+    # DB instance: snapshots span two pages and only the second lacks a TagList
+    responses = _fake_shared_responses()
+    responses.update({
+        'describe_db_instances': {'DBInstances': [_fake_db_instance(
+            'db-1',
+            DBSubnetGroup={'DBSubnetGroupName': 'subnets-1', 'VpcId': 'vpc-1'},
+            VpcSecurityGroups=[{'VpcSecurityGroupId': 'sg-1'}],
+            DBParameterGroups=[{'DBParameterGroupName': 'pg-1'}],
+            OptionGroupMemberships=[{'OptionGroupName': 'og-1'}]
+        )]},
+        'describe_db_parameter_groups': {'DBParameterGroups': [{
+            'DBParameterGroupName': 'pg-1', 'DBParameterGroupFamily': 'mysql8.0',
+            'Description': 'Instance parameters', 'TagList': []
+        }]},
+        'describe_option_groups': {'OptionGroupsList': [{
+            'OptionGroupName': 'og-1', 'OptionGroupDescription': 'Instance options',
+            'EngineName': 'mysql', 'MajorEngineVersion': '8.0', 'TagList': []
+        }]}
+    })
+    rds = FakeAWSClient(responses, pages={'describe_db_snapshots': [
+        {'DBSnapshots': [_fake_snapshot('snap-1', tagged=True)]},
+        {'DBSnapshots': [_fake_snapshot('snap-2', tagged=False)]}
+    ]})
     
-    # Test tag formatting
-    print("\n5.1 Tag Formatting:")
-    print("-" * 30)
-    test_tags = {
-        'Name': 'TestResource',
-        'Environment': 'Production',
-        'Owner': 'DataTeam',
-        'Project': 'WebApp',
-        'CostCenter': '12345'
+    result, errors = discover(rds, 'discover_db_instance_resources', 'db-1')
+    assert not errors, f"Unexpected errors: {errors}"
+    assert rds.count('describe_db_instances') == 1, "DB instance described more than once"
+    assert rds.pages_served['describe_db_snapshots'] == 2, "Not every snapshot page was read"
+    snapshots = [r for r in result['resources'] if r['resource_type'] == 'DB Snapshot']
+    assert [r['resource_id'] for r in snapshots] == ['snap-1', 'snap-2'], "Snapshots missing from a page"
+    assert [kwargs['ResourceName'] for name, kwargs in rds.calls if name == 'list_tags_for_resource'] == [
+        'arn:aws:rds:us-east-1:123456789012:snapshot:snap-2'
+    ], "Tags fetched for a resource whose TagList was embedded"
+    assert snapshots[0]['tags'] == {'Backup': 'snap-1'}
+    assert snapshots[1]['tags'] == {'Fetched': 'snap-2'}
+    assert result['summary'] == {
+        'total_resources': 7, 'snapshots': 2, 'security_groups': 1,
+        'subnet_groups': 1, 'parameter_groups': 1, 'option_groups': 1
     }
-    formatted_tags = formatter._format_tags(test_tags)
-    print(f"Input tags: {test_tags}")
-    print(f"Formatted: {formatted_tags}")
+    assert result['summary']['total_resources'] == len(result['resources'])
+    print("DB instance: one describe, every snapshot page read, tags fetched only when not embedded")
     
-    # Test empty tags
-    empty_tags = formatter._format_tags({})
-    print(f"Empty tags: {empty_tags}")
+    # DB cluster: members span two listing pages and one member is missing from it
+    responses = _fake_shared_responses()
+    responses.update({
+        'describe_db_clusters': {'DBClusters': [{
+            'DBClusterIdentifier': 'cluster-1',
+            'DBClusterArn': 'arn:aws:rds:us-east-1:123456789012:cluster:cluster-1',
+            'Engine': 'aurora-mysql', 'EngineVersion': '8.0.mysql_aurora.3.04.0', 'Status': 'available',
+            'DBSubnetGroup': 'subnets-1', 'VpcSecurityGroups': [{'VpcSecurityGroupId': 'sg-1'}],
+            'DBClusterParameterGroup': 'cpg-1',
+            'DBClusterMembers': [
+                {'DBInstanceIdentifier': 'member-1', 'IsClusterWriter': True},
+                {'DBInstanceIdentifier': 'member-2', 'PromotionTier': 1},
+                {'DBInstanceIdentifier': 'member-gone'}
+            ],
+            'TagList': [{'Key': 'Name', 'Value': 'cluster-1'}]
+        }]},
+        'describe_db_instances': {'DBInstances': []},
+        'describe_db_cluster_parameter_groups': {'DBClusterParameterGroups': [{
+            'DBClusterParameterGroupName': 'cpg-1', 'DBParameterGroupFamily': 'aurora-mysql8.0',
+            'Description': 'Cluster parameters', 'TagList': []
+        }]}
+    })
+    rds = FakeAWSClient(responses, pages={
+        'describe_db_cluster_snapshots': [{'DBClusterSnapshots': [{
+            'DBClusterSnapshotIdentifier': 'cluster-snap-1', 'DBClusterIdentifier': 'cluster-1',
+            'SnapshotType': 'manual', 'Status': 'available', 'TagList': []
+        }]}],
+        'describe_db_instances': [
+            {'DBInstances': [_fake_db_instance('member-1', DBClusterIdentifier='cluster-1')]},
+            {'DBInstances': [_fake_db_instance('member-2', DBClusterIdentifier='cluster-1')]}
+        ]
+    })
     
-    # Test resource details formatting
-    print("\n5.2 Resource Details Formatting:")
-    print("-" * 30)
-    test_resource = {
-        'resource_type': 'DB Instance',
-        'resource_id': 'test-instance',
-        'engine': 'mysql',
-        'status': 'available',
-        'allocated_storage': 20,
-        'tags': {'Name': 'Test'}
+    result, errors = discover(rds, 'discover_db_cluster_resources', 'cluster-1')
+    assert rds.count('describe_db_clusters') == 1, "DB cluster described more than once"
+    assert rds.count('describe_db_instances') == 0, "Cluster members described one by one"
+    listings = [kwargs for name, kwargs in rds.calls if name == 'paginate:describe_db_instances']
+    assert len(listings) == 1, "Expected exactly one member listing"
+    assert listings[0]['Filters'] == [{'Name': 'db-cluster-id', 'Values': ['cluster-1']}]
+    assert rds.pages_served['describe_db_instances'] == 2, "Not every member page was read"
+    assert rds.count('list_tags_for_resource') == 0, "Tags fetched although every TagList was embedded"
+    members = [r for r in result['resources'] if r['resource_type'] == 'DB Cluster Member']
+    assert [r['resource_id'] for r in members] == ['member-1', 'member-2'], "Members missing from a page"
+    assert len(errors) == 1 and 'member-gone' in errors[0], f"Missing member not logged: {errors}"
+    assert result['summary'] == {
+        'total_resources': 7, 'cluster_snapshots': 1, 'security_groups': 1, 'subnet_groups': 1,
+        'parameter_groups': 1, 'option_groups': 0, 'cluster_members': 2
     }
-    formatted_details = formatter._format_resource_details(test_resource)
-    print(f"Input resource: {test_resource}")
-    print(f"Formatted details: {formatted_details}")
+    assert result['summary']['total_resources'] == len(result['resources'])
+    print("DB cluster: one describe, one filtered member listing, missing member logged and skipped")
     
-    print("\n✓ Individual component tests completed!")
+    print("\n✓ Discovery API call tests completed!")
 
 
 def main():
     """Main test function."""
+    parser = argparse.ArgumentParser(description='Test the AWS RDS Resource Discovery Tool')
+    parser.add_argument('--quick', action='store_true',
+                        help='Skip the table format variants and the cluster detailed table')
+    args = parser.parse_args()
+    
     try:
         print("Starting AWS RDS Resource Discovery Tool Tests...")
+        # Wall-clock time is formatted once; the duration comes from the monotonic clock
+        start = time.monotonic()
         print(f"Test started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
         # Run table formatting tests
-        test_table_formatting()
+        test_table_formatting(quick=args.quick)
         
         # Run individual component tests
         test_individual_components()
         
-        print(f"\n{'='*80}")
+        # Run CLI import cost tests
+        test_lazy_imports()
+        
+        # Run boto3 client reuse tests
+        test_client_cache()
+        
+        # Run describe response cache tests
+        test_response_cache()
+        
+        # Run discovery result serialization tests
+        test_to_json()
+        
+        # Run discovery API call tests
+        test_discovery_api_calls()
+        
+        print(f"\n{_BANNER}")
         print("🎉 ALL TESTS PASSED SUCCESSFULLY! 🎉")
-        print(f"{'='*80}")
-        print(f"Test completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(_BANNER)
+        print(f"Test completed in {time.monotonic() - start:.2f}s")
         
         # List generated files
         print(f"\nGenerated test files:")
@@ -489,16 +976,18 @@ def main():
         ]
         
         for file in test_files:
-            if os.path.exists(file):
-                size = os.path.getsize(file)
-                print(f"  ✓ {file} ({size} bytes)")
-            else:
+            # One stat per file covers both the existence check and the size
+            try:
+                size = os.stat(file).st_size
+            except FileNotFoundError:
                 print(f"  ✗ {file} (not found)")
+            else:
+                print(f"  ✓ {file} ({size} bytes)")
         
     except Exception as e:
-        print(f"\n{'='*80}")
+        print(f"\n{_BANNER}")
         print(f"❌ TEST FAILED: {str(e)}")
-        print(f"{'='*80}")
+        print(_BANNER)
         sys.exit(1)
 
 